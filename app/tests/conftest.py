@@ -0,0 +1,128 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+import asyncio
+import logging
+
+import pytest
+import pytest_asyncio
+from pytest_asyncio import is_async_test
+from passlib.context import CryptContext
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.core.database import Base
+# Register every model so the mappers resolve and Base.metadata holds the full schema
+import app.auth.models
+import app.test_management.models
+import app.mcq.models
+import app.core.security
+
+
+# Test database URL (in-memory SQLite for testing)
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+# Keep engine and pool logging off even if a log level is raised for a run
+# (e.g. --log-level=INFO), so SQLAlchemy never builds per-statement records
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+logging.getLogger("sqlalchemy.pool").setLevel(logging.WARNING)
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session-scoped event loop."""
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the shared event loop on uvloop where it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Hash passwords with the minimum bcrypt cost so register/login calls stay cheap."""
+    # Hashes still verify normally; bcrypt reads the cost factor from the hash itself
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            app.core.security,
+            "pwd_context",
+            CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4)
+        )
+        yield
+
+
+def _configure_connection(dbapi_connection, connection_record):
+    """Apply fast, non-durable settings suitable for a throwaway test database."""
+    # The SQLite driver defers BEGIN on its own, which breaks SAVEPOINTs; let SQLAlchemy emit it
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # Enforce foreign keys like PostgreSQL does
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def _emit_begin(conn):
+    """Emit BEGIN so SAVEPOINTs work under the SQLite driver."""
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_engine():
+    """Create one test engine shared by every module that requests it."""
+    # One connection for the whole session, so every session sees the same in-memory database
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        echo=False,
+        # Room for every statement the suite compiles, so none is evicted and recompiled
+        query_cache_size=1200,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    event.listen(engine.sync_engine, "connect", _configure_connection)
+    event.listen(engine.sync_engine, "begin", _emit_begin)
+    
+    yield engine
+    
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _schema(test_engine):
+    """Create the schema once for the whole session."""
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    
+    yield
+    
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+@pytest_asyncio.fixture
+async def db_session(test_engine, _schema):
+    """Create test database session inside a transaction that is rolled back after the test."""
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session_factory = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
+        
+        async with session_factory() as session:
+            yield session
+        
+        await trans.rollback()
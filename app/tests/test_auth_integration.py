@@ -6,6 +6,7 @@ import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.core.database import Base, get_db
 from app.auth.router import router as auth_router
 from app.auth.models import User
@@ -33,10 +34,10 @@ async def get_test_db():
             await session.close()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def app():
-    """Create test FastAPI application."""
-    test_app = FastAPI()
+    """Create test FastAPI application once for the whole session."""
+    test_app = FastAPI(default_response_class=ORJSONResponse)
     test_app.include_router(auth_router)
     
     # Override database dependency
@@ -45,9 +46,9 @@ async def app():
     return test_app
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def client(app: FastAPI):
-    """Create test HTTP client."""
+    """Create test HTTP client once for the whole session."""
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
@@ -1,98 +1,139 @@
 """
 Integration tests for MCQ endpoints.
 """
+import orjson
+
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from fastapi import FastAPI
-from app.core.database import Base, get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPAuthorizationCredentials
+from app.core.database import get_db
+from app.core.security import create_access_token, get_current_user, get_password_hash, security
 from app.auth.router import router as auth_router
 from app.test_management.router import router as test_router
 from app.mcq.router import router as mcq_router
 from app.auth.models import User
 from app.test_management.models import Test
-from app.mcq.models import MCQ
-
 
-# Test database URL (in-memory SQLite for testing)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-# Create test engine and session
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-TestAsyncSession = async_sessionmaker(
-    test_engine, class_=AsyncSession, expire_on_commit=False
-)
+# Stable request bodies, serialized once instead of on every request
+JSON_HEADERS = {"Content-Type": "application/json"}
+MCQ_BODY = orjson.dumps({
+    "title": "Question",
+    "option_1": "A", "option_2": "B", "option_3": "C", "option_4": "D",
+    "correct_answer": 1
+})
 
 
-async def get_test_db():
-    """Override database dependency for testing."""
-    async with TestAsyncSession() as session:
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+async def get_test_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> User:
+    """Override current user dependency to skip JWT decoding and the user lookup."""
+    user = request.app.state.users_by_token.get(credentials.credentials)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials"
+        )
+    return user
 
 
-@pytest_asyncio.fixture
-async def app():
-    """Create test FastAPI application."""
-    test_app = FastAPI()
+def create_test_app() -> FastAPI:
+    """Create a test FastAPI application bound to the current test's rolled-back session."""
+    test_app = FastAPI(default_response_class=ORJSONResponse)
     test_app.include_router(auth_router)
     test_app.include_router(test_router)
     test_app.include_router(mcq_router)
     
+    async def get_test_db():
+        """Override database dependency to use the current test's rolled-back session."""
+        yield test_app.state.db_session
+    
     # Override database dependency
     test_app.dependency_overrides[get_db] = get_test_db
     
     return test_app
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
+async def app():
+    """Create test FastAPI application with real JWT authentication once for the whole session."""
+    return create_test_app()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def stub_auth_app():
+    """Create test FastAPI application that resolves users from the test's token map."""
+    test_app = create_test_app()
+    test_app.dependency_overrides[get_current_user] = get_test_current_user
+    return test_app
+
+
+@pytest_asyncio.fixture(scope="session")
 async def client(app: FastAPI):
-    """Create test HTTP client."""
+    """Create test HTTP client once for the whole session."""
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
-@pytest_asyncio.fixture(autouse=True)
-async def setup_database():
-    """Set up test database before each test."""
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    yield
-    
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+@pytest_asyncio.fixture(scope="session")
+async def stub_auth_client(stub_auth_app: FastAPI):
+    """Create test HTTP client for the stubbed-authentication app once for the whole session."""
+    transport = ASGITransport(app=stub_auth_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 
-@pytest_asyncio.fixture
-async def authenticated_user(client: AsyncClient):
-    """Create and authenticate a test user."""
-    # Register user
-    response = await client.post(
-        "/auth/register",
-        json={
-            "email": "test@example.com",
-            "password": "password123"
-        }
-    )
+@pytest.fixture
+def users_by_token(stub_auth_app: FastAPI) -> dict[str, User]:
+    """Map this test's access tokens to their users for the stubbed-authentication app."""
+    stub_auth_app.state.users_by_token = {}
+    return stub_auth_app.state.users_by_token
+
+
+@pytest.fixture(autouse=True)
+def bind_db_session(app: FastAPI, stub_auth_app: FastAPI, db_session: AsyncSession):
+    """Point the shared apps' database dependency at this test's session."""
+    app.state.db_session = db_session
+    stub_auth_app.state.db_session = db_session
+
+
+async def create_user(
+    session: AsyncSession, users_by_token: dict[str, User], email: str, password_hash: str
+) -> dict:
+    """Insert a user directly and mint its access token without going through /auth/register."""
+    user = User(email=email, password_hash=password_hash)
+    session.add(user)
+    await session.flush()
     
-    assert response.status_code == 201
-    data = response.json()
+    access_token = create_access_token(data={"sub": str(user.id), "email": user.email})
+    users_by_token[access_token] = user
     
     return {
-        "user_id": data["user_id"],
-        "access_token": data["access_token"],
-        "email": data["email"]
+        "user_id": user.id,
+        "access_token": access_token,
+        "email": user.email
     }
 
 
+@pytest.fixture(scope="session")
+def password_hash():
+    """Hash the fixture users' password once for the whole session."""
+    # Computed here rather than at import so it uses the test suite's cheap bcrypt cost
+    return get_password_hash("password123")
+
+
+@pytest_asyncio.fixture
+async def authenticated_user(db_session: AsyncSession, users_by_token: dict[str, User], password_hash: str):
+    """Create and authenticate a test user inside the test's rolled-back transaction."""
+    return await create_user(db_session, users_by_token, "test@example.com", password_hash)
+
+
 @pytest_asyncio.fixture
 async def auth_headers(authenticated_user):
     """Get authentication headers."""
@@ -100,43 +141,29 @@ async def auth_headers(authenticated_user):
 
 
 @pytest_asyncio.fixture
-async def test_with_user(client: AsyncClient, authenticated_user: dict, auth_headers: dict):
+async def test_with_user(db_session: AsyncSession, authenticated_user: dict):
     """Create a test for the authenticated user."""
-    response = await client.post(
-        "/tests/",
-        json={
-            "title": "Sample Test",
-            "description": "A test for MCQ questions"
-        },
-        headers=auth_headers
+    test = Test(
+        title="Sample Test",
+        description="A test for MCQ questions",
+        user_id=authenticated_user["user_id"]
     )
+    db_session.add(test)
+    await db_session.flush()
     
-    assert response.status_code == 201
-    test_data = response.json()
-    test_data["access_token"] = authenticated_user["access_token"]
-    return test_data
+    return {
+        "id": test.id,
+        "title": test.title,
+        "description": test.description,
+        "user_id": test.user_id,
+        "access_token": authenticated_user["access_token"]
+    }
 
 
 @pytest_asyncio.fixture
-async def another_authenticated_user(client: AsyncClient):
+async def another_authenticated_user(db_session: AsyncSession, users_by_token: dict[str, User], password_hash: str):
     """Create and authenticate another test user."""
-    # Register user
-    response = await client.post(
-        "/auth/register",
-        json={
-            "email": "other@example.com",
-            "password": "password123"
-        }
-    )
-    
-    assert response.status_code == 201
-    data = response.json()
-    
-    return {
-        "user_id": data["user_id"],
-        "access_token": data["access_token"],
-        "email": data["email"]
-    }
+    return await create_user(db_session, users_by_token, "other@example.com", password_hash)
 
 
 @pytest_asyncio.fixture
@@ -145,6 +172,12 @@ async def other_auth_headers(another_authenticated_user):
     return {"Authorization": f"Bearer {another_authenticated_user['access_token']}"}
 
 
+@pytest.fixture
+def headers_fixture(request):
+    """Resolve the authentication headers fixture named by the indirect parameter."""
+    return request.getfixturevalue(request.param)
+
+
 class TestMCQEndpoints:
     """Integration tests for MCQ endpoints."""
     
@@ -183,11 +216,11 @@ class TestMCQEndpoints:
         assert "updated_at" in data
     
     @pytest.mark.asyncio
-    async def test_create_mcq_without_description(self, client: AsyncClient, auth_headers: dict, test_with_user: dict):
+    async def test_create_mcq_without_description(self, stub_auth_client: AsyncClient, auth_headers: dict, test_with_user: dict):
         """Test creating an MCQ without description."""
         test_id = test_with_user["id"]
         
-        response = await client.post(
+        response = await stub_auth_client.post(
             f"/tests/{test_id}/questions",
             json={
                 "title": "What is 2+2?",
@@ -214,55 +247,53 @@ class TestMCQEndpoints:
         
         response = await client.post(
             f"/tests/{test_id}/questions",
-            json={
-                "title": "Question",
-                "option_1": "A", "option_2": "B", "option_3": "C", "option_4": "D",
-                "correct_answer": 1
-            }
+            content=MCQ_BODY,
+            headers=JSON_HEADERS
         )
         
         assert response.status_code == 403
     
     @pytest.mark.asyncio
-    async def test_create_mcq_test_not_found(self, client: AsyncClient, auth_headers: dict):
-        """Test creating an MCQ for a non-existent test."""
+    async def test_create_mcq_invalid_token(self, client: AsyncClient, test_with_user: dict):
+        """Test creating an MCQ with a token that does not decode."""
+        test_id = test_with_user["id"]
+        
         response = await client.post(
-            "/tests/999999/questions",
-            json={
-                "title": "Question",
-                "option_1": "A", "option_2": "B", "option_3": "C", "option_4": "D",
-                "correct_answer": 1
-            },
-            headers=auth_headers
+            f"/tests/{test_id}/questions",
+            content=MCQ_BODY,
+            headers={**JSON_HEADERS, "Authorization": "Bearer invalid-token"}
         )
         
+        assert response.status_code == 401
+    
+    @pytest.mark.asyncio
+    async def test_create_mcq_test_not_found(self, stub_auth_client: AsyncClient, auth_headers: dict):
+        """Test creating an MCQ for a non-existent test."""
+        response = await stub_auth_client.post("/tests/999999/questions", content=MCQ_BODY, headers={**JSON_HEADERS, **auth_headers})
+        
         assert response.status_code == 404
         assert "Test not found or access denied" in response.json()["detail"]
     
     @pytest.mark.asyncio
-    async def test_create_mcq_access_denied(self, client: AsyncClient, other_auth_headers: dict, test_with_user: dict):
+    async def test_create_mcq_access_denied(self, stub_auth_client: AsyncClient, other_auth_headers: dict, test_with_user: dict):
         """Test creating an MCQ for another user's test."""
         test_id = test_with_user["id"]
         
-        response = await client.post(
+        response = await stub_auth_client.post(
             f"/tests/{test_id}/questions",
-            json={
-                "title": "Question",
-                "option_1": "A", "option_2": "B", "option_3": "C", "option_4": "D",
-                "correct_answer": 1
-            },
-            headers=other_auth_headers
+            content=MCQ_BODY,
+            headers={**JSON_HEADERS, **other_auth_headers}
         )
         
         assert response.status_code == 404
         assert "Test not found or access denied" in response.json()["detail"]
     
     @pytest.mark.asyncio
-    async def test_create_mcq_invalid_correct_answer(self, client: AsyncClient, auth_headers: dict, test_with_user: dict):
+    async def test_create_mcq_invalid_correct_answer(self, stub_auth_client: AsyncClient, auth_headers: dict, test_with_user: dict):
         """Test creating an MCQ with invalid correct_answer."""
         test_id = test_with_user["id"]
         
-        response = await client.post(
+        response = await stub_auth_client.post(
             f"/tests/{test_id}/questions",
             json={
                 "title": "Question",
@@ -275,12 +306,12 @@ class TestMCQEndpoints:
         assert response.status_code == 422  # Validation error
     
     @pytest.mark.asyncio
-    async def test_get_test_questions_success(self, client: AsyncClient, auth_headers: dict, test_with_user: dict):
+    async def test_get_test_questions_success(self, stub_auth_client: AsyncClient, auth_headers: dict, test_with_user: dict):
         """Test getting all MCQ questions for a test."""
         test_id = test_with_user["id"]
         
         # Create some MCQs
-        mcq1_response = await client.post(
+        mcq1_response = await stub_auth_client.post(
             f"/tests/{test_id}/questions",
             json={
                 "title": "Question 1",
@@ -289,7 +320,7 @@ class TestMCQEndpoints:
             },
             headers=auth_headers
         )
-        mcq2_response = await client.post(
+        mcq2_response = await stub_auth_client.post(
             f"/tests/{test_id}/questions",
             json={
                 "title": "Question 2",
@@ -303,7 +334,7 @@ class TestMCQEndpoints:
         assert mcq2_response.status_code == 201
         
         # Get all questions
-        response = await client.get(f"/tests/{test_id}/questions", headers=auth_headers)
+        response = await stub_auth_client.get(f"/tests/{test_id}/questions", headers=auth_headers)
         
         assert response.status_code == 200
         data = response.json()
@@ -316,11 +347,11 @@ class TestMCQEndpoints:
         assert "Question 2" in question_titles
     
     @pytest.mark.asyncio
-    async def test_get_test_questions_empty(self, client: AsyncClient, auth_headers: dict, test_with_user: dict):
+    async def test_get_test_questions_empty(self, stub_auth_client: AsyncClient, auth_headers: dict, test_with_user: dict):
         """Test getting questions for a test with no questions."""
         test_id = test_with_user["id"]
         
-        response = await client.get(f"/tests/{test_id}/questions", headers=auth_headers)
+        response = await stub_auth_client.get(f"/tests/{test_id}/questions", headers=auth_headers)
         
         assert response.status_code == 200
         data = response.json()
@@ -338,11 +369,11 @@ class TestMCQEndpoints:
         assert response.status_code == 403
     
     @pytest.mark.asyncio
-    async def test_get_test_questions_access_denied(self, client: AsyncClient, other_auth_headers: dict, test_with_user: dict):
+    async def test_get_test_questions_access_denied(self, stub_auth_client: AsyncClient, other_auth_headers: dict, test_with_user: dict):
         """Test getting questions for another user's test."""
         test_id = test_with_user["id"]
         
-        response = await client.get(f"/tests/{test_id}/questions", headers=other_auth_headers)
+        response = await stub_auth_client.get(f"/tests/{test_id}/questions", headers=other_auth_headers)
         
         assert response.status_code == 404
         assert "Test not found or access denied" in response.json()["detail"]
@@ -384,42 +415,20 @@ class TestMCQEndpoints:
         assert data["test_id"] == test_id
     
     @pytest.mark.asyncio
-    async def test_get_mcq_question_not_found(self, client: AsyncClient, auth_headers: dict):
+    async def test_get_mcq_question_not_found(self, stub_auth_client: AsyncClient, auth_headers: dict):
         """Test getting a non-existent MCQ question."""
-        response = await client.get("/questions/999999", headers=auth_headers)
-        
-        assert response.status_code == 404
-        assert "MCQ question not found or access denied" in response.json()["detail"]
-    
-    @pytest.mark.asyncio
-    async def test_get_mcq_question_access_denied(self, client: AsyncClient, other_auth_headers: dict, test_with_user: dict):
-        """Test getting an MCQ question from another user's test."""
-        test_id = test_with_user["id"]
-        
-        # Create an MCQ as the first user
-        create_response = await client.post(
-            f"/tests/{test_id}/questions",
-            json={
-                "title": "Question",
-                "option_1": "A", "option_2": "B", "option_3": "C", "option_4": "D",
-                "correct_answer": 1
-            },
-            headers={"Authorization": f"Bearer {test_with_user['access_token']}"}
-        )
-        
-        # Try to get it as another user
-        response = await client.get(f"/questions/{create_response.json()['id']}", headers=other_auth_headers)
+        response = await stub_auth_client.get("/questions/999999", headers=auth_headers)
         
         assert response.status_code == 404
         assert "MCQ question not found or access denied" in response.json()["detail"]
     
     @pytest.mark.asyncio
-    async def test_get_mcq_question_public_success(self, client: AsyncClient, auth_headers: dict, test_with_user: dict):
+    async def test_get_mcq_question_public_success(self, stub_auth_client: AsyncClient, auth_headers: dict, test_with_user: dict):
         """Test getting an MCQ question in public format (without correct answer)."""
         test_id = test_with_user["id"]
         
         # Create an MCQ
-        create_response = await client.post(
+        create_response = await stub_auth_client.post(
             f"/tests/{test_id}/questions",
             json={
                 "title": "What is the capital of France?",
@@ -433,7 +442,7 @@ class TestMCQEndpoints:
         mcq_id = create_response.json()["id"]
         
         # Get the MCQ in public format
-        response = await client.get(f"/questions/{mcq_id}/public", headers=auth_headers)
+        response = await stub_auth_client.get(f"/questions/{mcq_id}/public", headers=auth_headers)
         
         assert response.status_code == 200
         data = response.json()
@@ -449,26 +458,22 @@ class TestMCQEndpoints:
         assert "correct_answer" not in data
     
     @pytest.mark.asyncio
-    async def test_get_mcq_question_by_test_success(self, client: AsyncClient, auth_headers: dict, test_with_user: dict):
+    async def test_get_mcq_question_by_test_success(self, stub_auth_client: AsyncClient, auth_headers: dict, test_with_user: dict):
         """Test getting an MCQ question by test and question ID."""
         test_id = test_with_user["id"]
         
         # Create an MCQ
-        create_response = await client.post(
+        create_response = await stub_auth_client.post(
             f"/tests/{test_id}/questions",
-            json={
-                "title": "Question",
-                "option_1": "A", "option_2": "B", "option_3": "C", "option_4": "D",
-                "correct_answer": 1
-            },
-            headers=auth_headers
+            content=MCQ_BODY,
+            headers={**JSON_HEADERS, **auth_headers}
         )
         
         assert create_response.status_code == 201
         mcq_id = create_response.json()["id"]
         
         # Get the MCQ by test and question ID
-        response = await client.get(f"/tests/{test_id}/questions/{mcq_id}", headers=auth_headers)
+        response = await stub_auth_client.get(f"/tests/{test_id}/questions/{mcq_id}", headers=auth_headers)
         
         assert response.status_code == 200
         data = response.json()
@@ -478,12 +483,12 @@ class TestMCQEndpoints:
         assert data["test_id"] == test_id
     
     @pytest.mark.asyncio
-    async def test_update_mcq_question_success(self, client: AsyncClient, auth_headers: dict, test_with_user: dict):
+    async def test_update_mcq_question_success(self, stub_auth_client: AsyncClient, auth_headers: dict, test_with_user: dict):
         """Test updating an MCQ question."""
         test_id = test_with_user["id"]
         
         # Create an MCQ
-        create_response = await client.post(
+        create_response = await stub_auth_client.post(
             f"/tests/{test_id}/questions",
             json={
                 "title": "Original Question",
@@ -498,7 +503,7 @@ class TestMCQEndpoints:
         mcq_id = create_response.json()["id"]
         
         # Update the MCQ
-        response = await client.patch(
+        response = await stub_auth_client.patch(
             f"/questions/{mcq_id}",
             json={
                 "title": "Updated Question",
@@ -522,9 +527,9 @@ class TestMCQEndpoints:
         assert data["test_id"] == test_id
     
     @pytest.mark.asyncio
-    async def test_update_mcq_question_not_found(self, client: AsyncClient, auth_headers: dict):
+    async def test_update_mcq_question_not_found(self, stub_auth_client: AsyncClient, auth_headers: dict):
         """Test updating a non-existent MCQ question."""
-        response = await client.patch(
+        response = await stub_auth_client.patch(
             "/questions/999999",
             json={"title": "Updated Question"},
             headers=auth_headers
@@ -534,38 +539,12 @@ class TestMCQEndpoints:
         assert "MCQ question not found or access denied" in response.json()["detail"]
     
     @pytest.mark.asyncio
-    async def test_update_mcq_question_access_denied(self, client: AsyncClient, other_auth_headers: dict, test_with_user: dict):
-        """Test updating an MCQ question from another user's test."""
-        test_id = test_with_user["id"]
-        
-        # Create an MCQ as the first user
-        create_response = await client.post(
-            f"/tests/{test_id}/questions",
-            json={
-                "title": "Question",
-                "option_1": "A", "option_2": "B", "option_3": "C", "option_4": "D",
-                "correct_answer": 1
-            },
-            headers={"Authorization": f"Bearer {test_with_user['access_token']}"}
-        )
-        
-        # Try to update it as another user
-        response = await client.patch(
-            f"/questions/{create_response.json()['id']}",
-            json={"title": "Updated Question"},
-            headers=other_auth_headers
-        )
-        
-        assert response.status_code == 404
-        assert "MCQ question not found or access denied" in response.json()["detail"]
-    
-    @pytest.mark.asyncio
-    async def test_delete_mcq_question_success(self, client: AsyncClient, auth_headers: dict, test_with_user: dict):
+    async def test_delete_mcq_question_success(self, stub_auth_client: AsyncClient, auth_headers: dict, test_with_user: dict):
         """Test deleting an MCQ question."""
         test_id = test_with_user["id"]
         
         # Create an MCQ
-        create_response = await client.post(
+        create_response = await stub_auth_client.post(
             f"/tests/{test_id}/questions",
             json={
                 "title": "Question to delete",
@@ -579,43 +558,58 @@ class TestMCQEndpoints:
         mcq_id = create_response.json()["id"]
         
         # Delete the MCQ
-        response = await client.patch(f"/questions/{mcq_id}/delete", headers=auth_headers)
+        response = await stub_auth_client.patch(f"/questions/{mcq_id}/delete", headers=auth_headers)
         
         assert response.status_code == 204
         
         # Verify the MCQ is deleted (should not be found)
-        get_response = await client.get(f"/questions/{mcq_id}", headers=auth_headers)
+        get_response = await stub_auth_client.get(f"/questions/{mcq_id}", headers=auth_headers)
         assert get_response.status_code == 404
     
     @pytest.mark.asyncio
-    async def test_delete_mcq_question_not_found(self, client: AsyncClient, auth_headers: dict):
+    async def test_delete_mcq_question_not_found(self, stub_auth_client: AsyncClient, auth_headers: dict):
         """Test deleting a non-existent MCQ question."""
-        response = await client.patch("/questions/999999/delete", headers=auth_headers)
+        response = await stub_auth_client.patch("/questions/999999/delete", headers=auth_headers)
         
         assert response.status_code == 404
         assert "MCQ question not found or access denied" in response.json()["detail"]
     
     @pytest.mark.asyncio
-    async def test_delete_mcq_question_access_denied(self, client: AsyncClient, other_auth_headers: dict, test_with_user: dict):
-        """Test deleting an MCQ question from another user's test."""
+    @pytest.mark.parametrize(
+        "headers_fixture, is_owner",
+        [("auth_headers", True), ("other_auth_headers", False)],
+        indirect=["headers_fixture"],
+        ids=["owner", "other_user"]
+    )
+    @pytest.mark.parametrize(
+        "method, suffix, payload, owner_status",
+        [
+            ("GET", "", None, 200),
+            ("PATCH", "", {"title": "Updated Question"}, 200),
+            ("PATCH", "/delete", None, 204),
+        ],
+        ids=["get", "update", "delete"]
+    )
+    async def test_mcq_question_access(
+        self, stub_auth_client: AsyncClient, test_with_user: dict, headers_fixture: dict,
+        is_owner: bool, method: str, suffix: str, payload: dict | None, owner_status: int
+    ):
+        """Test that only the owner of the test can read, update or delete its MCQ question."""
         test_id = test_with_user["id"]
         
         # Create an MCQ as the first user
-        create_response = await client.post(
+        create_response = await stub_auth_client.post(
             f"/tests/{test_id}/questions",
-            json={
-                "title": "Question",
-                "option_1": "A", "option_2": "B", "option_3": "C", "option_4": "D",
-                "correct_answer": 1
-            },
-            headers={"Authorization": f"Bearer {test_with_user['access_token']}"}
+            content=MCQ_BODY,
+            headers={**JSON_HEADERS, "Authorization": f"Bearer {test_with_user['access_token']}"}
         )
         
-        # Try to delete it as another user
-        response = await client.patch(
-            f"/questions/{create_response.json()['id']}/delete",
-            headers=other_auth_headers
+        response = await stub_auth_client.request(
+            method, f"/questions/{create_response.json()['id']}{suffix}", json=payload, headers=headers_fixture
         )
         
-        assert response.status_code == 404
-        assert "MCQ question not found or access denied" in response.json()["detail"]
\ No newline at end of file
+        if is_owner:
+            assert response.status_code == owner_status
+        else:
+            assert response.status_code == 404
+            assert "MCQ question not found or access denied" in response.json()["detail"]
\ No newline at end of file
@@ -3,49 +3,25 @@ Unit tests for MCQ repository.
 """
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from app.core.database import Base
+from datetime import datetime
+from sqlalchemy import bindparam, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.auth.models import User
 from app.test_management.models import Test
 from app.mcq.models import MCQ
 from app.mcq.repository import MCQRepository
 
 
-# Test database URL (in-memory SQLite for testing)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
-
-# Create test engine and session
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-TestAsyncSession = async_sessionmaker(
-    test_engine, class_=AsyncSession, expire_on_commit=False
-)
-
-
-@pytest_asyncio.fixture
-async def db_session():
-    """Create test database session."""
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    async with TestAsyncSession() as session:
-        yield session
-        await session.rollback()
-    
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
-
 @pytest_asyncio.fixture
 async def test_user_and_test(db_session: AsyncSession):
-    """Create a test user and test."""
+    """Create a test user and test inside the test's rolled-back transaction."""
     # Create user
     user = User(
         email="test@example.com",
         password_hash="hashed_password"
     )
     db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    await db_session.flush()
     
     # Create test
     test = Test(
@@ -54,72 +30,93 @@ async def test_user_and_test(db_session: AsyncSession):
         user_id=user.id
     )
     db_session.add(test)
-    await db_session.commit()
-    await db_session.refresh(test)
+    await db_session.flush()
     
     return user, test
 
 
+# Statements used by the helpers below, built once at import
+_INSERT_MCQ_RETURNING_ID = insert(MCQ).returning(MCQ.id, sort_by_parameter_order=True)
+_SELECT_MCQ_IS_DELETED = select(MCQ.is_deleted).where(MCQ.id == bindparam("id"))
+
+
+async def _bulk_make_mcqs(db_session: AsyncSession, test_id: int, specs: list[dict]) -> list[int]:
+    """Insert MCQs in one statement, bypassing the repository's per-row commit, and return their ids."""
+    rows = [
+        {
+            "option_1": "A", "option_2": "B", "option_3": "C", "option_4": "D",
+            "correct_answer": 1, "test_id": test_id,
+            **spec
+        }
+        for spec in specs
+    ]
+    result = await db_session.scalars(_INSERT_MCQ_RETURNING_ID, rows)
+    return list(result.all())
+
+
+async def _is_deleted(db_session: AsyncSession, mcq_id: int) -> bool:
+    """Read an MCQ's soft delete flag directly, bypassing the repository's active-only filter."""
+    return await db_session.scalar(_SELECT_MCQ_IS_DELETED, {"id": mcq_id})
+
+
 @pytest_asyncio.fixture
 async def mcq_repository(db_session: AsyncSession):
-    """Create an MCQ repository."""
+    """Create an MCQ repository bound to the test session."""
     return MCQRepository(db_session)
 
 
+@pytest_asyncio.fixture
+async def mcq_factory(mcq_repository: MCQRepository, test_user_and_test):
+    """Return a coroutine that creates an MCQ in the seeded test, with optional field overrides."""
+    user, test = test_user_and_test
+    
+    async def make(**overrides) -> MCQ:
+        return await mcq_repository.create(**{
+            "title": "Original Question",
+            "description": "Original description",
+            "option_1": "A", "option_2": "B", "option_3": "C", "option_4": "D",
+            "correct_answer": 1, "test_id": test.id,
+            **overrides
+        })
+    
+    return make
+
+
 class TestMCQRepository:
     """Test cases for MCQRepository."""
     
     @pytest.mark.asyncio
-    async def test_create_mcq(self, mcq_repository: MCQRepository, test_user_and_test):
-        """Test creating a new MCQ question."""
-        user, test = test_user_and_test
-        
-        mcq = await mcq_repository.create(
-            title="What is the capital of France?",
-            description="A geography question",
-            option_1="London",
-            option_2="Berlin",
-            option_3="Paris",
-            option_4="Madrid",
-            correct_answer=3,
-            test_id=test.id
-        )
-        
-        assert mcq.id is not None
-        assert mcq.title == "What is the capital of France?"
-        assert mcq.description == "A geography question"
-        assert mcq.option_1 == "London"
-        assert mcq.option_2 == "Berlin"
-        assert mcq.option_3 == "Paris"
-        assert mcq.option_4 == "Madrid"
-        assert mcq.correct_answer == 3
-        assert mcq.test_id == test.id
-        assert mcq.is_deleted is False
-    
-    @pytest.mark.asyncio
-    async def test_create_mcq_without_description(self, mcq_repository: MCQRepository, test_user_and_test):
-        """Test creating an MCQ without description."""
+    @pytest.mark.parametrize(
+        "title, description, options, correct_answer",
+        [
+            ("What is the capital of France?", "A geography question", ("London", "Berlin", "Paris", "Madrid"), 3),
+            ("What is 2+2?", None, ("3", "4", "5", "6"), 2),
+        ],
+        ids=["with_description", "without_description"]
+    )
+    async def test_create_mcq(
+        self, mcq_repository: MCQRepository, test_user_and_test,
+        title, description, options, correct_answer
+    ):
+        """Test creating a new MCQ question, with and without a description."""
         user, test = test_user_and_test
         
         mcq = await mcq_repository.create(
-            title="What is 2+2?",
-            description=None,
-            option_1="3",
-            option_2="4",
-            option_3="5",
-            option_4="6",
-            correct_answer=2,
+            title=title,
+            description=description,
+            option_1=options[0],
+            option_2=options[1],
+            option_3=options[2],
+            option_4=options[3],
+            correct_answer=correct_answer,
             test_id=test.id
         )
         
         assert mcq.id is not None
-        assert mcq.title == "What is 2+2?"
-        assert mcq.description is None
-        assert mcq.option_1 == "3"
-        assert mcq.option_2 == "4"
-        assert mcq.option_3 == "5"
-        assert mcq.option_4 == "6"
-        assert mcq.correct_answer == 2
+        assert mcq.title == title
+        assert mcq.description == description
+        assert (mcq.option_1, mcq.option_2, mcq.option_3, mcq.option_4) == options
+        assert mcq.correct_answer == correct_answer
         assert mcq.test_id == test.id
         assert mcq.is_deleted is False
     
@@ -161,53 +158,31 @@ class TestMCQRepository:
         assert retrieved_mcq is None
     
     @pytest.mark.asyncio
-    async def test_get_by_id_soft_deleted(self, mcq_repository: MCQRepository, test_user_and_test):
+    async def test_get_by_id_soft_deleted(self, mcq_repository: MCQRepository, test_user_and_test, db_session: AsyncSession):
         """Test that soft deleted MCQs are not returned by get_by_id."""
         user, test = test_user_and_test
         
         # Create an MCQ
-        created_mcq = await mcq_repository.create(
-            title="Question",
-            description=None,
-            option_1="A",
-            option_2="B",
-            option_3="C",
-            option_4="D",
-            correct_answer=1,
-            test_id=test.id
-        )
+        [mcq_id] = await _bulk_make_mcqs(db_session, test.id, [{"title": "Question"}])
         
         # Soft delete the MCQ
-        await mcq_repository.soft_delete(created_mcq.id)
+        await mcq_repository.soft_delete(mcq_id)
         
         # Try to get the MCQ
-        retrieved_mcq = await mcq_repository.get_by_id(created_mcq.id)
+        retrieved_mcq = await mcq_repository.get_by_id(mcq_id)
         assert retrieved_mcq is None
     
     @pytest.mark.asyncio
-    async def test_get_all_by_test(self, mcq_repository: MCQRepository, test_user_and_test):
+    async def test_get_all_by_test(self, mcq_repository: MCQRepository, test_user_and_test, db_session: AsyncSession):
         """Test getting all MCQs for a test."""
         user, test = test_user_and_test
         
-        # Create multiple MCQs
-        mcq1 = await mcq_repository.create(
-            title="Question 1",
-            description=None,
-            option_1="A1", option_2="B1", option_3="C1", option_4="D1",
-            correct_answer=1, test_id=test.id
-        )
-        mcq2 = await mcq_repository.create(
-            title="Question 2",
-            description=None,
-            option_1="A2", option_2="B2", option_3="C2", option_4="D2",
-            correct_answer=2, test_id=test.id
-        )
-        mcq3 = await mcq_repository.create(
-            title="Question 3",
-            description=None,
-            option_1="A3", option_2="B3", option_3="C3", option_4="D3",
-            correct_answer=3, test_id=test.id
-        )
+        # Create multiple MCQs out of creation order, with distinct timestamps to order by
+        await _bulk_make_mcqs(db_session, test.id, [
+            {"title": "Question 3", "correct_answer": 3, "created_at": datetime(2024, 1, 8, 10, 2, 0)},
+            {"title": "Question 1", "correct_answer": 1, "created_at": datetime(2024, 1, 8, 10, 0, 0)},
+            {"title": "Question 2", "correct_answer": 2, "created_at": datetime(2024, 1, 8, 10, 1, 0)},
+        ])
         
         # Get all MCQs for the test
         mcqs = await mcq_repository.get_all_by_test(test.id)
@@ -224,26 +199,18 @@ class TestMCQRepository:
         assert mcqs[2].title == "Question 3"
     
     @pytest.mark.asyncio
-    async def test_get_all_by_test_excludes_soft_deleted(self, mcq_repository: MCQRepository, test_user_and_test):
+    async def test_get_all_by_test_excludes_soft_deleted(self, mcq_repository: MCQRepository, test_user_and_test, db_session: AsyncSession):
         """Test that get_all_by_test excludes soft deleted MCQs."""
         user, test = test_user_and_test
         
         # Create multiple MCQs
-        mcq1 = await mcq_repository.create(
-            title="Question 1",
-            description=None,
-            option_1="A1", option_2="B1", option_3="C1", option_4="D1",
-            correct_answer=1, test_id=test.id
-        )
-        mcq2 = await mcq_repository.create(
-            title="Question 2",
-            description=None,
-            option_1="A2", option_2="B2", option_3="C2", option_4="D2",
-            correct_answer=2, test_id=test.id
-        )
+        mcq1_id, mcq2_id = await _bulk_make_mcqs(db_session, test.id, [
+            {"title": "Question 1", "correct_answer": 1},
+            {"title": "Question 2", "correct_answer": 2},
+        ])
         
         # Soft delete one MCQ
-        await mcq_repository.soft_delete(mcq1.id)
+        await mcq_repository.soft_delete(mcq1_id)
         
         # Get all MCQs for the test
         mcqs = await mcq_repository.get_all_by_test(test.id)
@@ -260,93 +227,66 @@ class TestMCQRepository:
         assert len(mcqs) == 0
     
     @pytest.mark.asyncio
-    async def test_update_mcq_all_fields(self, mcq_repository: MCQRepository, test_user_and_test):
-        """Test updating all fields of an MCQ."""
+    @pytest.mark.parametrize(
+        "updates, expected",
+        [
+            (
+                dict(
+                    title="Updated Question",
+                    description="Updated description",
+                    option_1="Updated A",
+                    option_2="Updated B",
+                    option_3="Updated C",
+                    option_4="Updated D",
+                    correct_answer=2
+                ),
+                dict(
+                    title="Updated Question",
+                    description="Updated description",
+                    option_1="Updated A",
+                    option_2="Updated B",
+                    option_3="Updated C",
+                    option_4="Updated D",
+                    correct_answer=2
+                ),
+            ),
+            (
+                dict(title="Updated Question", correct_answer=3),
+                dict(
+                    title="Updated Question",
+                    description="Original description",
+                    option_1="A", option_2="B", option_3="C", option_4="D",
+                    correct_answer=3
+                ),
+            ),
+            (
+                dict(),
+                dict(
+                    title="Original Question",
+                    description="Original description",
+                    option_1="A", option_2="B", option_3="C", option_4="D",
+                    correct_answer=1
+                ),
+            ),
+        ],
+        ids=["all_fields", "partial_fields", "no_changes"]
+    )
+    async def test_update_mcq(self, mcq_repository: MCQRepository, mcq_factory, test_user_and_test, updates, expected):
+        """Test updating an MCQ; fields left out of the update stay unchanged."""
         user, test = test_user_and_test
         
         # Create an MCQ
-        created_mcq = await mcq_repository.create(
-            title="Original Question",
-            description="Original description",
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=1, test_id=test.id
-        )
+        created_mcq = await mcq_factory()
         
         # Update the MCQ
-        updated_mcq = await mcq_repository.update(
-            mcq_id=created_mcq.id,
-            title="Updated Question",
-            description="Updated description",
-            option_1="Updated A",
-            option_2="Updated B",
-            option_3="Updated C",
-            option_4="Updated D",
-            correct_answer=2
-        )
+        updated_mcq = await mcq_repository.update(mcq_id=created_mcq.id, **updates)
         
         assert updated_mcq is not None
         assert updated_mcq.id == created_mcq.id
-        assert updated_mcq.title == "Updated Question"
-        assert updated_mcq.description == "Updated description"
-        assert updated_mcq.option_1 == "Updated A"
-        assert updated_mcq.option_2 == "Updated B"
-        assert updated_mcq.option_3 == "Updated C"
-        assert updated_mcq.option_4 == "Updated D"
-        assert updated_mcq.correct_answer == 2
+        for field, value in expected.items():
+            assert getattr(updated_mcq, field) == value
         assert updated_mcq.test_id == test.id
     
-    @pytest.mark.asyncio
-    async def test_update_mcq_partial_fields(self, mcq_repository: MCQRepository, test_user_and_test):
-        """Test updating only some fields of an MCQ."""
-        user, test = test_user_and_test
-        
-        # Create an MCQ
-        created_mcq = await mcq_repository.create(
-            title="Original Question",
-            description="Original description",
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=1, test_id=test.id
-        )
-        
-        # Update only title and correct_answer
-        updated_mcq = await mcq_repository.update(
-            mcq_id=created_mcq.id,
-            title="Updated Question",
-            correct_answer=3
-        )
-        
-        assert updated_mcq is not None
-        assert updated_mcq.id == created_mcq.id
-        assert updated_mcq.title == "Updated Question"
-        assert updated_mcq.description == "Original description"  # Unchanged
-        assert updated_mcq.option_1 == "A"  # Unchanged
-        assert updated_mcq.option_2 == "B"  # Unchanged
-        assert updated_mcq.option_3 == "C"  # Unchanged
-        assert updated_mcq.option_4 == "D"  # Unchanged
-        assert updated_mcq.correct_answer == 3
-    
-    @pytest.mark.asyncio
-    async def test_update_mcq_no_changes(self, mcq_repository: MCQRepository, test_user_and_test):
-        """Test updating an MCQ with no changes."""
-        user, test = test_user_and_test
-        
-        # Create an MCQ
-        created_mcq = await mcq_repository.create(
-            title="Question",
-            description="Description",
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=1, test_id=test.id
-        )
-        
-        # Update with no changes
-        updated_mcq = await mcq_repository.update(mcq_id=created_mcq.id)
-        
-        assert updated_mcq is not None
-        assert updated_mcq.id == created_mcq.id
-        assert updated_mcq.title == "Question"
-        assert updated_mcq.description == "Description"
-        assert updated_mcq.correct_answer == 1
-    
     @pytest.mark.asyncio
     async def test_update_mcq_nonexistent(self, mcq_repository: MCQRepository):
         """Test updating a non-existent MCQ."""
@@ -357,48 +297,39 @@ class TestMCQRepository:
         assert updated_mcq is None
     
     @pytest.mark.asyncio
-    async def test_update_mcq_soft_deleted(self, mcq_repository: MCQRepository, test_user_and_test):
+    async def test_update_mcq_soft_deleted(self, mcq_repository: MCQRepository, test_user_and_test, db_session: AsyncSession):
         """Test updating a soft deleted MCQ."""
         user, test = test_user_and_test
         
         # Create an MCQ
-        created_mcq = await mcq_repository.create(
-            title="Question",
-            description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=1, test_id=test.id
-        )
+        [mcq_id] = await _bulk_make_mcqs(db_session, test.id, [{"title": "Question"}])
         
         # Soft delete the MCQ
-        await mcq_repository.soft_delete(created_mcq.id)
+        await mcq_repository.soft_delete(mcq_id)
         
         # Try to update the soft deleted MCQ
         updated_mcq = await mcq_repository.update(
-            mcq_id=created_mcq.id,
+            mcq_id=mcq_id,
             title="Updated Question"
         )
         assert updated_mcq is None
     
     @pytest.mark.asyncio
-    async def test_soft_delete_mcq(self, mcq_repository: MCQRepository, test_user_and_test):
+    async def test_soft_delete_mcq(self, mcq_repository: MCQRepository, test_user_and_test, db_session: AsyncSession):
         """Test soft deleting an MCQ."""
         user, test = test_user_and_test
         
         # Create an MCQ
-        created_mcq = await mcq_repository.create(
-            title="Question",
-            description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=1, test_id=test.id
-        )
+        [mcq_id] = await _bulk_make_mcqs(db_session, test.id, [{"title": "Question"}])
         
         # Soft delete the MCQ
-        result = await mcq_repository.soft_delete(created_mcq.id)
+        result = await mcq_repository.soft_delete(mcq_id)
         assert result is True
         
         # Verify the MCQ is soft deleted
-        retrieved_mcq = await mcq_repository.get_by_id(created_mcq.id)
+        retrieved_mcq = await mcq_repository.get_by_id(mcq_id)
         assert retrieved_mcq is None
+        assert await _is_deleted(db_session, mcq_id) is True
     
     @pytest.mark.asyncio
     async def test_soft_delete_mcq_nonexistent(self, mcq_repository: MCQRepository):
@@ -407,28 +338,23 @@ class TestMCQRepository:
         assert result is False
     
     @pytest.mark.asyncio
-    async def test_soft_delete_mcq_already_deleted(self, mcq_repository: MCQRepository, test_user_and_test):
+    async def test_soft_delete_mcq_already_deleted(self, mcq_repository: MCQRepository, test_user_and_test, db_session: AsyncSession):
         """Test soft deleting an already soft deleted MCQ."""
         user, test = test_user_and_test
         
         # Create an MCQ
-        created_mcq = await mcq_repository.create(
-            title="Question",
-            description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=1, test_id=test.id
-        )
+        [mcq_id] = await _bulk_make_mcqs(db_session, test.id, [{"title": "Question"}])
         
         # Soft delete the MCQ
-        result1 = await mcq_repository.soft_delete(created_mcq.id)
+        result1 = await mcq_repository.soft_delete(mcq_id)
         assert result1 is True
         
         # Try to soft delete again
-        result2 = await mcq_repository.soft_delete(created_mcq.id)
+        result2 = await mcq_repository.soft_delete(mcq_id)
         assert result2 is False
     
     @pytest.mark.asyncio
-    async def test_count_by_test(self, mcq_repository: MCQRepository, test_user_and_test):
+    async def test_count_by_test(self, mcq_repository: MCQRepository, test_user_and_test, db_session: AsyncSession):
         """Test counting MCQs for a test."""
         user, test = test_user_and_test
         
@@ -437,45 +363,33 @@ class TestMCQRepository:
         assert count == 0
         
         # Create some MCQs
-        await mcq_repository.create(
-            title="Q1", description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=1, test_id=test.id
-        )
-        await mcq_repository.create(
-            title="Q2", description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=2, test_id=test.id
-        )
+        await _bulk_make_mcqs(db_session, test.id, [
+            {"title": "Q1", "correct_answer": 1},
+            {"title": "Q2", "correct_answer": 2},
+        ])
         
         count = await mcq_repository.count_by_test(test.id)
         assert count == 2
     
     @pytest.mark.asyncio
-    async def test_count_by_test_excludes_soft_deleted(self, mcq_repository: MCQRepository, test_user_and_test):
+    async def test_count_by_test_excludes_soft_deleted(self, mcq_repository: MCQRepository, test_user_and_test, db_session: AsyncSession):
         """Test that count_by_test excludes soft deleted MCQs."""
         user, test = test_user_and_test
         
         # Create MCQs
-        mcq1 = await mcq_repository.create(
-            title="Q1", description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=1, test_id=test.id
-        )
-        mcq2 = await mcq_repository.create(
-            title="Q2", description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=2, test_id=test.id
-        )
+        mcq1_id, mcq2_id = await _bulk_make_mcqs(db_session, test.id, [
+            {"title": "Q1", "correct_answer": 1},
+            {"title": "Q2", "correct_answer": 2},
+        ])
         
         # Soft delete one
-        await mcq_repository.soft_delete(mcq1.id)
+        await mcq_repository.soft_delete(mcq1_id)
         
         count = await mcq_repository.count_by_test(test.id)
         assert count == 1
     
     @pytest.mark.asyncio
-    async def test_exists(self, mcq_repository: MCQRepository, test_user_and_test):
+    async def test_exists(self, mcq_repository: MCQRepository, test_user_and_test, db_session: AsyncSession):
         """Test checking if an MCQ exists."""
         user, test = test_user_and_test
         
@@ -484,22 +398,17 @@ class TestMCQRepository:
         assert exists is False
         
         # Create an MCQ
-        created_mcq = await mcq_repository.create(
-            title="Question",
-            description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=1, test_id=test.id
-        )
+        [mcq_id] = await _bulk_make_mcqs(db_session, test.id, [{"title": "Question"}])
         
         # MCQ exists
-        exists = await mcq_repository.exists(created_mcq.id)
+        exists = await mcq_repository.exists(mcq_id)
         assert exists is True
         
         # Soft delete the MCQ
-        await mcq_repository.soft_delete(created_mcq.id)
+        await mcq_repository.soft_delete(mcq_id)
         
         # MCQ no longer exists
-        exists = await mcq_repository.exists(created_mcq.id)
+        exists = await mcq_repository.exists(mcq_id)
         assert exists is False
     
     @pytest.mark.asyncio
@@ -515,36 +424,27 @@ class TestMCQRepository:
         )
         db_session.add(test2)
         await db_session.commit()
-        await db_session.refresh(test2)
         
         # Create MCQs in different tests
-        mcq1 = await mcq_repository.create(
-            title="Question 1",
-            description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=1, test_id=test.id
-        )
-        mcq2 = await mcq_repository.create(
-            title="Question 2",
-            description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=2, test_id=test2.id
-        )
+        mcq1_id, mcq2_id = await _bulk_make_mcqs(db_session, test.id, [
+            {"title": "Question 1", "correct_answer": 1},
+            {"title": "Question 2", "correct_answer": 2, "test_id": test2.id},
+        ])
         
         # Get MCQ1 from test1
-        retrieved_mcq = await mcq_repository.get_by_id_and_test(mcq1.id, test.id)
+        retrieved_mcq = await mcq_repository.get_by_id_and_test(mcq1_id, test.id)
         assert retrieved_mcq is not None
-        assert retrieved_mcq.id == mcq1.id
+        assert retrieved_mcq.id == mcq1_id
         assert retrieved_mcq.test_id == test.id
         
         # Try to get MCQ1 from test2 (should fail)
-        retrieved_mcq = await mcq_repository.get_by_id_and_test(mcq1.id, test2.id)
+        retrieved_mcq = await mcq_repository.get_by_id_and_test(mcq1_id, test2.id)
         assert retrieved_mcq is None
         
         # Get MCQ2 from test2
-        retrieved_mcq = await mcq_repository.get_by_id_and_test(mcq2.id, test2.id)
+        retrieved_mcq = await mcq_repository.get_by_id_and_test(mcq2_id, test2.id)
         assert retrieved_mcq is not None
-        assert retrieved_mcq.id == mcq2.id
+        assert retrieved_mcq.id == mcq2_id
         assert retrieved_mcq.test_id == test2.id
     
     @pytest.mark.asyncio
@@ -560,24 +460,13 @@ class TestMCQRepository:
         )
         db_session.add(test2)
         await db_session.commit()
-        await db_session.refresh(test2)
         
         # Create MCQs in both tests
-        mcq1 = await mcq_repository.create(
-            title="Q1", description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=1, test_id=test.id
-        )
-        mcq2 = await mcq_repository.create(
-            title="Q2", description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=2, test_id=test.id
-        )
-        mcq3 = await mcq_repository.create(
-            title="Q3", description=None,
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=3, test_id=test2.id
-        )
+        mcq1_id, mcq2_id, mcq3_id = await _bulk_make_mcqs(db_session, test.id, [
+            {"title": "Q1", "correct_answer": 1},
+            {"title": "Q2", "correct_answer": 2},
+            {"title": "Q3", "correct_answer": 3, "test_id": test2.id},
+        ])
         
         # Soft delete all MCQs for test1
         deleted_count = await mcq_repository.soft_delete_all_by_test(test.id)
@@ -590,7 +479,7 @@ class TestMCQRepository:
         # Verify test2 MCQs are not affected
         test2_mcqs = await mcq_repository.get_all_by_test(test2.id)
         assert len(test2_mcqs) == 1
-        assert test2_mcqs[0].id == mcq3.id
+        assert test2_mcqs[0].id == mcq3_id
     
     @pytest.mark.asyncio
     async def test_soft_delete_all_by_test_empty(self, mcq_repository: MCQRepository, test_user_and_test):
@@ -2,70 +2,134 @@
 Unit tests for MCQ service.
 """
 import pytest
-import pytest_asyncio
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, call
 from datetime import datetime
-from app.mcq.models import MCQ
 from app.mcq.repository import MCQRepository
 from app.mcq.service import MCQService
 from app.mcq.schemas import MCQCreateRequest, MCQUpdateRequest, MCQResponse, MCQListResponse, MCQPublicResponse
 from app.test_management.repository import TestRepository
 
 
-@pytest_asyncio.fixture
-async def mock_mcq_repository():
+# Fixed timestamps shared by every MCQ row in this module
+CREATED_AT = datetime(2024, 1, 8, 10, 0, 0)
+UPDATED_AT = datetime(2024, 1, 8, 11, 0, 0)
+
+
+@pytest.fixture
+def mock_mcq_repository():
     """Create a mock MCQ repository."""
     return AsyncMock(spec=MCQRepository)
 
 
-@pytest_asyncio.fixture
-async def mock_test_repository():
+@pytest.fixture
+def mock_test_repository():
     """Create a mock test repository."""
     return AsyncMock(spec=TestRepository)
 
 
-@pytest_asyncio.fixture
-async def mcq_service(mock_mcq_repository, mock_test_repository):
+@pytest.fixture
+def mcq_service(mock_mcq_repository, mock_test_repository):
     """Create an MCQ service with mock repositories."""
     return MCQService(mock_mcq_repository, mock_test_repository)
 
 
-@pytest_asyncio.fixture
+# MCQResponse fields for sample_mcq, compared against whole response dumps
+_SAMPLE_MCQ_RESPONSE = {
+    "id": 1,
+    "title": "What is the capital of France?",
+    "description": "A geography question",
+    "option_1": "London",
+    "option_2": "Berlin",
+    "option_3": "Paris",
+    "option_4": "Madrid",
+    "correct_answer": 3,
+    "test_id": 1,
+    "created_at": CREATED_AT,
+    "updated_at": CREATED_AT
+}
+
+# Expected response after test_update_mcq_success's partial update
+_UPDATED_MCQ_RESPONSE = {
+    **_SAMPLE_MCQ_RESPONSE,
+    "title": "Updated question",
+    "correct_answer": 2,
+    "updated_at": UPDATED_AT
+}
+
+
+@pytest.fixture(scope="session")
 def sample_mcq():
-    """Create a sample MCQ object."""
-    mcq = MagicMock(spec=MCQ)
-    mcq.id = 1
-    mcq.title = "What is the capital of France?"
-    mcq.description = "A geography question"
-    mcq.option_1 = "London"
-    mcq.option_2 = "Berlin"
-    mcq.option_3 = "Paris"
-    mcq.option_4 = "Madrid"
-    mcq.correct_answer = 3
-    mcq.test_id = 1
-    mcq.created_at = datetime(2024, 1, 8, 10, 0, 0)
-    mcq.updated_at = datetime(2024, 1, 8, 10, 0, 0)
-    mcq.is_deleted = False
-    return mcq
+    """Create a model-like sample MCQ; tests only read it."""
+    return SimpleNamespace(**_SAMPLE_MCQ_RESPONSE, is_deleted=False)
+
+
+# Request inputs built once; the tests only read them
+_SAMPLE_CREATE_REQUEST = MCQCreateRequest(
+    title="What is the capital of France?",
+    description="A geography question",
+    option_1="London",
+    option_2="Berlin",
+    option_3="Paris",
+    option_4="Madrid",
+    correct_answer=3
+)
+_MINIMAL_CREATE_REQUEST = MCQCreateRequest(
+    title="Question",
+    option_1="A", option_2="B", option_3="C", option_4="D",
+    correct_answer=1
+)
+_SAMPLE_UPDATE_REQUEST = MCQUpdateRequest(
+    title="Updated question",
+    correct_answer=2
+)
+
+# Repository calls the create/update success tests expect for the sample requests
+_EXPECTED_CREATE_CALL = call.create(
+    title="What is the capital of France?",
+    description="A geography question",
+    option_1="London",
+    option_2="Berlin",
+    option_3="Paris",
+    option_4="Madrid",
+    correct_answer=3,
+    test_id=1
+)
+_EXPECTED_UPDATE_CALL = call.update(
+    mcq_id=1,
+    title="Updated question",
+    description=None,
+    option_1=None,
+    option_2=None,
+    option_3=None,
+    option_4=None,
+    correct_answer=2
+)
+
+
+def _wire_access_ok(mcq_repo, test_repo, mcq):
+    """Make the MCQ lookup find mcq and the ownership check pass."""
+    mcq_repo.get_by_id.return_value = mcq
+    test_repo.exists.return_value = True
+
+
+@pytest.fixture
+def mcq_in_state(request, mock_mcq_repository, mock_test_repository, sample_mcq):
+    """Wire the MCQ lookup and ownership check for a "missing" or "not_owned" MCQ."""
+    state = request.param
+    mock_mcq_repository.get_by_id.return_value = None if state == "missing" else sample_mcq
+    mock_test_repository.exists.return_value = False
+    return state
 
 
 class TestMCQService:
     """Test cases for MCQService."""
     
-    @pytest.mark.asyncio
     async def test_create_mcq_success(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                     mock_test_repository: AsyncMock, sample_mcq: MCQ):
+                                     mock_test_repository: AsyncMock, sample_mcq: SimpleNamespace):
         """Test creating a new MCQ question successfully."""
         # Setup
-        request = MCQCreateRequest(
-            title="What is the capital of France?",
-            description="A geography question",
-            option_1="London",
-            option_2="Berlin",
-            option_3="Paris",
-            option_4="Madrid",
-            correct_answer=3
-        )
+        request = _SAMPLE_CREATE_REQUEST
         test_id = 1
         user_id = 1
         
@@ -76,363 +140,122 @@ class TestMCQService:
         result = await mcq_service.create_mcq(request, test_id, user_id)
         
         # Verify
-        mock_test_repository.exists.assert_called_once_with(test_id, user_id)
-        mock_mcq_repository.create.assert_called_once_with(
-            title="What is the capital of France?",
-            description="A geography question",
-            option_1="London",
-            option_2="Berlin",
-            option_3="Paris",
-            option_4="Madrid",
-            correct_answer=3,
-            test_id=test_id
-        )
+        assert mock_test_repository.mock_calls == [call.exists(test_id, user_id)]
+        assert mock_mcq_repository.mock_calls == [_EXPECTED_CREATE_CALL]
         assert isinstance(result, MCQResponse)
-        assert result.id == 1
-        assert result.title == "What is the capital of France?"
-        assert result.correct_answer == 3
-        assert result.test_id == 1
-    
-    @pytest.mark.asyncio
-    async def test_create_mcq_user_does_not_own_test(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                                    mock_test_repository: AsyncMock):
-        """Test creating an MCQ when user doesn't own the test."""
-        # Setup
-        request = MCQCreateRequest(
-            title="Question",
-            option_1="A", option_2="B", option_3="C", option_4="D",
-            correct_answer=1
-        )
-        test_id = 1
-        user_id = 1
-        
-        mock_test_repository.exists.return_value = False
-        
-        # Execute
-        result = await mcq_service.create_mcq(request, test_id, user_id)
-        
-        # Verify
-        mock_test_repository.exists.assert_called_once_with(test_id, user_id)
-        mock_mcq_repository.create.assert_not_called()
-        assert result is None
+        assert result.model_dump() == _SAMPLE_MCQ_RESPONSE
     
-    @pytest.mark.asyncio
-    async def test_get_mcq_success(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                  mock_test_repository: AsyncMock, sample_mcq: MCQ):
-        """Test getting an MCQ successfully."""
+    @pytest.mark.parametrize(
+        "method_name, response_cls, has_answer",
+        [
+            pytest.param("get_mcq", MCQResponse, True, id="get_mcq"),
+            pytest.param("get_mcq_public", MCQPublicResponse, False, id="get_mcq_public"),
+        ]
+    )
+    async def test_get_mcq_variants_success(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock,
+                                            mock_test_repository: AsyncMock, sample_mcq: SimpleNamespace,
+                                            method_name, response_cls, has_answer):
+        """Test getting an MCQ in full and public (without correct answer) format."""
         # Setup
         mcq_id = 1
         user_id = 1
         
-        mock_mcq_repository.get_by_id.return_value = sample_mcq
-        mock_test_repository.exists.return_value = True
+        _wire_access_ok(mock_mcq_repository, mock_test_repository, sample_mcq)
         
         # Execute
-        result = await mcq_service.get_mcq(mcq_id, user_id)
+        result = await getattr(mcq_service, method_name)(mcq_id, user_id)
         
         # Verify
-        mock_mcq_repository.get_by_id.assert_called_once_with(mcq_id)
-        mock_test_repository.exists.assert_called_once_with(sample_mcq.test_id, user_id)
-        assert isinstance(result, MCQResponse)
-        assert result.id == 1
-        assert result.title == "What is the capital of France?"
-        assert result.correct_answer == 3
-    
-    @pytest.mark.asyncio
-    async def test_get_mcq_not_found(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                    mock_test_repository: AsyncMock):
-        """Test getting a non-existent MCQ."""
-        # Setup
-        mcq_id = 999
-        user_id = 1
-        
-        mock_mcq_repository.get_by_id.return_value = None
-        
-        # Execute
-        result = await mcq_service.get_mcq(mcq_id, user_id)
-        
-        # Verify
-        mock_mcq_repository.get_by_id.assert_called_once_with(mcq_id)
-        mock_test_repository.exists.assert_not_called()
-        assert result is None
+        assert mock_mcq_repository.mock_calls == [call.get_by_id(mcq_id)]
+        assert mock_test_repository.mock_calls == [call.exists(sample_mcq.test_id, user_id)]
+        assert isinstance(result, response_cls)
+        dumped = result.model_dump()
+        assert ("correct_answer" in dumped) is has_answer
+        assert dumped == {
+            k: v for k, v in _SAMPLE_MCQ_RESPONSE.items() if has_answer or k != "correct_answer"
+        }
     
-    @pytest.mark.asyncio
-    async def test_get_mcq_user_does_not_own_test(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                                 mock_test_repository: AsyncMock, sample_mcq: MCQ):
-        """Test getting an MCQ when user doesn't own the test."""
-        # Setup
-        mcq_id = 1
-        user_id = 2  # Different user
-        
-        mock_mcq_repository.get_by_id.return_value = sample_mcq
-        mock_test_repository.exists.return_value = False
-        
-        # Execute
-        result = await mcq_service.get_mcq(mcq_id, user_id)
-        
-        # Verify
-        mock_mcq_repository.get_by_id.assert_called_once_with(mcq_id)
-        mock_test_repository.exists.assert_called_once_with(sample_mcq.test_id, user_id)
-        assert result is None
-    
-    @pytest.mark.asyncio
-    async def test_get_mcq_public_success(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                         mock_test_repository: AsyncMock, sample_mcq: MCQ):
-        """Test getting an MCQ in public format (without correct answer)."""
-        # Setup
-        mcq_id = 1
-        user_id = 1
-        
-        mock_mcq_repository.get_by_id.return_value = sample_mcq
-        mock_test_repository.exists.return_value = True
-        
-        # Execute
-        result = await mcq_service.get_mcq_public(mcq_id, user_id)
-        
-        # Verify
-        mock_mcq_repository.get_by_id.assert_called_once_with(mcq_id)
-        mock_test_repository.exists.assert_called_once_with(sample_mcq.test_id, user_id)
-        assert isinstance(result, MCQPublicResponse)
-        assert result.id == 1
-        assert result.title == "What is the capital of France?"
-        # Verify correct_answer is not included in public response
-        assert not hasattr(result, 'correct_answer')
-    
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("n", [0, 1, 5])
     async def test_get_test_mcqs_success(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                        mock_test_repository: AsyncMock, sample_mcq: MCQ):
+                                        mock_test_repository: AsyncMock, sample_mcq: SimpleNamespace, n):
         """Test getting all MCQs for a test successfully."""
         # Setup
         test_id = 1
         user_id = 1
-        mcqs = [sample_mcq]
+        mcqs = [sample_mcq] * n
         
         mock_test_repository.exists.return_value = True
         mock_mcq_repository.get_all_by_test.return_value = mcqs
-        mock_mcq_repository.count_by_test.return_value = 1
+        mock_mcq_repository.count_by_test.return_value = len(mcqs)
         
         # Execute
         result = await mcq_service.get_test_mcqs(test_id, user_id)
         
         # Verify
-        mock_test_repository.exists.assert_called_once_with(test_id, user_id)
-        mock_mcq_repository.get_all_by_test.assert_called_once_with(test_id)
-        mock_mcq_repository.count_by_test.assert_called_once_with(test_id)
+        assert mock_test_repository.mock_calls == [call.exists(test_id, user_id)]
+        assert mock_mcq_repository.mock_calls == [call.get_all_by_test(test_id), call.count_by_test(test_id)]
         assert isinstance(result, MCQListResponse)
-        assert len(result.questions) == 1
-        assert result.total == 1
-        assert result.questions[0].id == 1
-    
-    @pytest.mark.asyncio
-    async def test_get_test_mcqs_user_does_not_own_test(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                                       mock_test_repository: AsyncMock):
-        """Test getting MCQs when user doesn't own the test."""
-        # Setup
-        test_id = 1
-        user_id = 2  # Different user
-        
-        mock_test_repository.exists.return_value = False
-        
-        # Execute
-        result = await mcq_service.get_test_mcqs(test_id, user_id)
-        
-        # Verify
-        mock_test_repository.exists.assert_called_once_with(test_id, user_id)
-        mock_mcq_repository.get_all_by_test.assert_not_called()
-        mock_mcq_repository.count_by_test.assert_not_called()
-        assert result is None
+        assert result.model_dump() == {"questions": [_SAMPLE_MCQ_RESPONSE] * n, "total": n}
     
-    @pytest.mark.asyncio
     async def test_update_mcq_success(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                     mock_test_repository: AsyncMock, sample_mcq: MCQ):
+                                     mock_test_repository: AsyncMock, sample_mcq: SimpleNamespace):
         """Test updating an MCQ successfully."""
         # Setup
         mcq_id = 1
         user_id = 1
-        request = MCQUpdateRequest(
-            title="Updated question",
-            correct_answer=2
-        )
+        request = _SAMPLE_UPDATE_REQUEST
         
-        updated_mcq = MagicMock(spec=MCQ)
-        updated_mcq.id = 1
-        updated_mcq.title = "Updated question"
-        updated_mcq.description = "A geography question"
-        updated_mcq.option_1 = "London"
-        updated_mcq.option_2 = "Berlin"
-        updated_mcq.option_3 = "Paris"
-        updated_mcq.option_4 = "Madrid"
-        updated_mcq.correct_answer = 2
-        updated_mcq.test_id = 1
-        updated_mcq.created_at = datetime(2024, 1, 8, 10, 0, 0)
-        updated_mcq.updated_at = datetime(2024, 1, 8, 11, 0, 0)
+        updated_mcq = SimpleNamespace(**_UPDATED_MCQ_RESPONSE)
         
-        mock_mcq_repository.get_by_id.return_value = sample_mcq
-        mock_test_repository.exists.return_value = True
+        _wire_access_ok(mock_mcq_repository, mock_test_repository, sample_mcq)
         mock_mcq_repository.update.return_value = updated_mcq
         
         # Execute
         result = await mcq_service.update_mcq(mcq_id, request, user_id)
         
         # Verify
-        mock_mcq_repository.get_by_id.assert_called_once_with(mcq_id)
-        mock_test_repository.exists.assert_called_once_with(sample_mcq.test_id, user_id)
-        mock_mcq_repository.update.assert_called_once_with(
-            mcq_id=mcq_id,
-            title="Updated question",
-            description=None,
-            option_1=None,
-            option_2=None,
-            option_3=None,
-            option_4=None,
-            correct_answer=2
-        )
+        assert mock_test_repository.mock_calls == [call.exists(sample_mcq.test_id, user_id)]
+        assert mock_mcq_repository.mock_calls == [call.get_by_id(mcq_id), _EXPECTED_UPDATE_CALL]
         assert isinstance(result, MCQResponse)
-        assert result.id == 1
-        assert result.title == "Updated question"
-        assert result.correct_answer == 2
-    
-    @pytest.mark.asyncio
-    async def test_update_mcq_not_found(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                       mock_test_repository: AsyncMock):
-        """Test updating a non-existent MCQ."""
-        # Setup
-        mcq_id = 999
-        user_id = 1
-        request = MCQUpdateRequest(title="Updated question")
-        
-        mock_mcq_repository.get_by_id.return_value = None
-        
-        # Execute
-        result = await mcq_service.update_mcq(mcq_id, request, user_id)
-        
-        # Verify
-        mock_mcq_repository.get_by_id.assert_called_once_with(mcq_id)
-        mock_test_repository.exists.assert_not_called()
-        mock_mcq_repository.update.assert_not_called()
-        assert result is None
-    
-    @pytest.mark.asyncio
-    async def test_update_mcq_user_does_not_own_test(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                                    mock_test_repository: AsyncMock, sample_mcq: MCQ):
-        """Test updating an MCQ when user doesn't own the test."""
-        # Setup
-        mcq_id = 1
-        user_id = 2  # Different user
-        request = MCQUpdateRequest(title="Updated question")
-        
-        mock_mcq_repository.get_by_id.return_value = sample_mcq
-        mock_test_repository.exists.return_value = False
-        
-        # Execute
-        result = await mcq_service.update_mcq(mcq_id, request, user_id)
-        
-        # Verify
-        mock_mcq_repository.get_by_id.assert_called_once_with(mcq_id)
-        mock_test_repository.exists.assert_called_once_with(sample_mcq.test_id, user_id)
-        mock_mcq_repository.update.assert_not_called()
-        assert result is None
+        assert result.model_dump() == _UPDATED_MCQ_RESPONSE
     
-    @pytest.mark.asyncio
     async def test_delete_mcq_success(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                     mock_test_repository: AsyncMock, sample_mcq: MCQ):
+                                     mock_test_repository: AsyncMock, sample_mcq: SimpleNamespace):
         """Test deleting an MCQ successfully."""
         # Setup
         mcq_id = 1
         user_id = 1
         
-        mock_mcq_repository.get_by_id.return_value = sample_mcq
-        mock_test_repository.exists.return_value = True
+        _wire_access_ok(mock_mcq_repository, mock_test_repository, sample_mcq)
         mock_mcq_repository.soft_delete.return_value = True
         
         # Execute
         result = await mcq_service.delete_mcq(mcq_id, user_id)
         
         # Verify
-        mock_mcq_repository.get_by_id.assert_called_once_with(mcq_id)
-        mock_test_repository.exists.assert_called_once_with(sample_mcq.test_id, user_id)
-        mock_mcq_repository.soft_delete.assert_called_once_with(mcq_id)
+        assert mock_test_repository.mock_calls == [call.exists(sample_mcq.test_id, user_id)]
+        assert mock_mcq_repository.mock_calls == [call.get_by_id(mcq_id), call.soft_delete(mcq_id)]
         assert result is True
     
-    @pytest.mark.asyncio
-    async def test_delete_mcq_not_found(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                       mock_test_repository: AsyncMock):
-        """Test deleting a non-existent MCQ."""
-        # Setup
-        mcq_id = 999
-        user_id = 1
-        
-        mock_mcq_repository.get_by_id.return_value = None
-        
-        # Execute
-        result = await mcq_service.delete_mcq(mcq_id, user_id)
-        
-        # Verify
-        mock_mcq_repository.get_by_id.assert_called_once_with(mcq_id)
-        mock_test_repository.exists.assert_not_called()
-        mock_mcq_repository.soft_delete.assert_not_called()
-        assert result is False
-    
-    @pytest.mark.asyncio
-    async def test_delete_mcq_user_does_not_own_test(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                                    mock_test_repository: AsyncMock, sample_mcq: MCQ):
-        """Test deleting an MCQ when user doesn't own the test."""
-        # Setup
-        mcq_id = 1
-        user_id = 2  # Different user
-        
-        mock_mcq_repository.get_by_id.return_value = sample_mcq
-        mock_test_repository.exists.return_value = False
-        
-        # Execute
-        result = await mcq_service.delete_mcq(mcq_id, user_id)
-        
-        # Verify
-        mock_mcq_repository.get_by_id.assert_called_once_with(mcq_id)
-        mock_test_repository.exists.assert_called_once_with(sample_mcq.test_id, user_id)
-        mock_mcq_repository.soft_delete.assert_not_called()
-        assert result is False
-    
-    @pytest.mark.asyncio
     async def test_user_can_access_mcq_success(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                              mock_test_repository: AsyncMock, sample_mcq: MCQ):
+                                              mock_test_repository: AsyncMock, sample_mcq: SimpleNamespace):
         """Test checking if user can access an MCQ successfully."""
         # Setup
         mcq_id = 1
         user_id = 1
         
-        mock_mcq_repository.get_by_id.return_value = sample_mcq
-        mock_test_repository.exists.return_value = True
+        _wire_access_ok(mock_mcq_repository, mock_test_repository, sample_mcq)
         
         # Execute
         result = await mcq_service.user_can_access_mcq(mcq_id, user_id)
         
         # Verify
-        mock_mcq_repository.get_by_id.assert_called_once_with(mcq_id)
-        mock_test_repository.exists.assert_called_once_with(sample_mcq.test_id, user_id)
+        assert mock_mcq_repository.mock_calls == [call.get_by_id(mcq_id)]
+        assert mock_test_repository.mock_calls == [call.exists(sample_mcq.test_id, user_id)]
         assert result is True
     
-    @pytest.mark.asyncio
-    async def test_user_can_access_mcq_not_found(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                                 mock_test_repository: AsyncMock):
-        """Test checking access for a non-existent MCQ."""
-        # Setup
-        mcq_id = 999
-        user_id = 1
-        
-        mock_mcq_repository.get_by_id.return_value = None
-        
-        # Execute
-        result = await mcq_service.user_can_access_mcq(mcq_id, user_id)
-        
-        # Verify
-        mock_mcq_repository.get_by_id.assert_called_once_with(mcq_id)
-        mock_test_repository.exists.assert_not_called()
-        assert result is False
-    
-    @pytest.mark.asyncio
     async def test_get_mcq_by_test_success(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                          mock_test_repository: AsyncMock, sample_mcq: MCQ):
+                                          mock_test_repository: AsyncMock, sample_mcq: SimpleNamespace):
         """Test getting an MCQ by ID and test ID successfully."""
         # Setup
         mcq_id = 1
@@ -446,32 +269,11 @@ class TestMCQService:
         result = await mcq_service.get_mcq_by_test(mcq_id, test_id, user_id)
         
         # Verify
-        mock_test_repository.exists.assert_called_once_with(test_id, user_id)
-        mock_mcq_repository.get_by_id_and_test.assert_called_once_with(mcq_id, test_id)
+        assert mock_test_repository.mock_calls == [call.exists(test_id, user_id)]
+        assert mock_mcq_repository.mock_calls == [call.get_by_id_and_test(mcq_id, test_id)]
         assert isinstance(result, MCQResponse)
-        assert result.id == 1
-        assert result.title == "What is the capital of France?"
+        assert result.model_dump() == _SAMPLE_MCQ_RESPONSE
     
-    @pytest.mark.asyncio
-    async def test_get_mcq_by_test_user_does_not_own_test(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                                         mock_test_repository: AsyncMock):
-        """Test getting an MCQ by test when user doesn't own the test."""
-        # Setup
-        mcq_id = 1
-        test_id = 1
-        user_id = 2  # Different user
-        
-        mock_test_repository.exists.return_value = False
-        
-        # Execute
-        result = await mcq_service.get_mcq_by_test(mcq_id, test_id, user_id)
-        
-        # Verify
-        mock_test_repository.exists.assert_called_once_with(test_id, user_id)
-        mock_mcq_repository.get_by_id_and_test.assert_not_called()
-        assert result is None
-    
-    @pytest.mark.asyncio
     async def test_delete_all_test_mcqs_success(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
                                                mock_test_repository: AsyncMock):
         """Test deleting all MCQs for a test successfully."""
@@ -486,14 +288,23 @@ class TestMCQService:
         result = await mcq_service.delete_all_test_mcqs(test_id, user_id)
         
         # Verify
-        mock_test_repository.exists.assert_called_once_with(test_id, user_id)
-        mock_mcq_repository.soft_delete_all_by_test.assert_called_once_with(test_id)
+        assert mock_test_repository.mock_calls == [call.exists(test_id, user_id)]
+        assert mock_mcq_repository.mock_calls == [call.soft_delete_all_by_test(test_id)]
         assert result == 3
     
-    @pytest.mark.asyncio
-    async def test_delete_all_test_mcqs_user_does_not_own_test(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock, 
-                                                              mock_test_repository: AsyncMock):
-        """Test deleting all MCQs when user doesn't own the test."""
+    @pytest.mark.parametrize(
+        "method_name, leading_args",
+        [
+            pytest.param("create_mcq", (_MINIMAL_CREATE_REQUEST,), id="create_mcq"),
+            pytest.param("get_test_mcqs", (), id="get_test_mcqs"),
+            pytest.param("get_mcq_by_test", (1,), id="get_mcq_by_test"),
+            pytest.param("delete_all_test_mcqs", (), id="delete_all_test_mcqs"),
+        ]
+    )
+    async def test_user_does_not_own_test(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock,
+                                          mock_test_repository: AsyncMock,
+                                          method_name, leading_args):
+        """Test that every test-level operation stops when the user doesn't own the test."""
         # Setup
         test_id = 1
         user_id = 2  # Different user
@@ -501,9 +312,39 @@ class TestMCQService:
         mock_test_repository.exists.return_value = False
         
         # Execute
-        result = await mcq_service.delete_all_test_mcqs(test_id, user_id)
+        result = await getattr(mcq_service, method_name)(*leading_args, test_id, user_id)
         
         # Verify
-        mock_test_repository.exists.assert_called_once_with(test_id, user_id)
-        mock_mcq_repository.soft_delete_all_by_test.assert_not_called()
-        assert result is None
\ No newline at end of file
+        assert mock_test_repository.mock_calls == [call.exists(test_id, user_id)]
+        assert mock_mcq_repository.mock_calls == []
+        assert result is None
+    
+    @pytest.mark.parametrize("mcq_in_state", ["missing", "not_owned"], indirect=True)
+    @pytest.mark.parametrize(
+        "method_name, args, expected",
+        [
+            pytest.param("get_mcq", (1, 2), None, id="get_mcq"),
+            pytest.param("get_mcq_public", (1, 2), None, id="get_mcq_public"),
+            pytest.param("update_mcq", (1, _SAMPLE_UPDATE_REQUEST, 2), None, id="update_mcq"),
+            pytest.param("delete_mcq", (1, 2), False, id="delete_mcq"),
+            pytest.param("user_can_access_mcq", (1, 2), False, id="user_can_access_mcq"),
+        ]
+    )
+    async def test_mcq_access_denied(self, mcq_service: MCQService, mock_mcq_repository: AsyncMock,
+                                     mock_test_repository: AsyncMock, sample_mcq: SimpleNamespace, mcq_in_state,
+                                     method_name, args, expected):
+        """Test that every MCQ-level operation stops when the MCQ is missing or not owned."""
+        # Setup
+        mcq_id = 1
+        user_id = 2
+        
+        # Execute
+        result = await getattr(mcq_service, method_name)(*args)
+        
+        # Verify
+        # The lookup is the only MCQ repository call; ownership is checked only if the MCQ exists
+        assert mock_mcq_repository.mock_calls == [call.get_by_id(mcq_id)]
+        assert mock_test_repository.mock_calls == (
+            [] if mcq_in_state == "missing" else [call.exists(sample_mcq.test_id, user_id)]
+        )
+        assert result is expected
@@ -4,89 +4,75 @@ Integration tests for test management endpoints.
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import FastAPI
-from app.core.database import Base, get_db
+from fastapi.responses import ORJSONResponse
+from app.core.database import get_db
+from app.core.security import create_access_token, get_password_hash
 from app.auth.router import router as auth_router
 from app.test_management.router import router as test_router
 from app.auth.models import User
 from app.test_management.models import Test
 
 
-# Test database URL (in-memory SQLite for testing)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Request bodies shared by reference instead of rebuilt in every test
+_CREATE_PAYLOAD = {
+    "title": "Python Basics Quiz",
+    "description": "A comprehensive quiz covering Python fundamentals"
+}
+_ORIGINAL_PAYLOAD = {"title": "Original Title", "description": "Original description"}
+_UPDATED_TITLE_PAYLOAD = {"title": "Updated Title"}
 
-# Create test engine and session
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-TestAsyncSession = async_sessionmaker(
-    test_engine, class_=AsyncSession, expire_on_commit=False
-)
 
-
-async def get_test_db():
-    """Override database dependency for testing."""
-    async with TestAsyncSession() as session:
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
-
-
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def app():
-    """Create test FastAPI application."""
-    test_app = FastAPI()
+    """Create test FastAPI application once for the whole session."""
+    test_app = FastAPI(default_response_class=ORJSONResponse)
     test_app.include_router(auth_router)
     test_app.include_router(test_router)
     
+    async def get_test_db():
+        """Override database dependency to use the current test's rolled-back session."""
+        yield test_app.state.db_session
+    
     # Override database dependency
     test_app.dependency_overrides[get_db] = get_test_db
     
     return test_app
 
 
-@pytest_asyncio.fixture
+@pytest.fixture(autouse=True)
+def bind_db_session(app: FastAPI, db_session: AsyncSession):
+    """Point the shared app's database dependency at this test's session."""
+    app.state.db_session = db_session
+
+
+@pytest_asyncio.fixture(scope="session")
 async def client(app: FastAPI):
-    """Create test HTTP client."""
+    """Create test HTTP client once for the whole session."""
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
 
 
-@pytest_asyncio.fixture(autouse=True)
-async def setup_database():
-    """Set up test database before each test."""
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    yield
-    
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+@pytest.fixture(scope="session")
+def password_hash():
+    """Hash the fixture user's password once for the whole session."""
+    return get_password_hash("password123")
 
 
 @pytest_asyncio.fixture
-async def authenticated_user(client: AsyncClient):
-    """Create and authenticate a test user."""
-    # Register user
-    response = await client.post(
-        "/auth/register",
-        json={
-            "email": "test@example.com",
-            "password": "password123"
-        }
-    )
-    
-    assert response.status_code == 201
-    data = response.json()
+async def authenticated_user(db_session: AsyncSession, password_hash: str):
+    """Create an authenticated test user inside the test's rolled-back transaction."""
+    # Insert the user directly and mint its token in-process instead of going through /auth/register
+    user = User(email="owner@example.com", password_hash=password_hash)
+    db_session.add(user)
+    await db_session.flush()
     
     return {
-        "user_id": data["user_id"],
-        "access_token": data["access_token"],
-        "email": data["email"]
+        "user_id": user.id,
+        "access_token": create_access_token(data={"sub": str(user.id), "email": user.email}),
+        "email": user.email
     }
 
 
@@ -104,10 +90,7 @@ class TestTestEndpoints:
         """Test successful test creation."""
         response = await client.post(
             "/tests/",
-            json={
-                "title": "Python Basics Quiz",
-                "description": "A comprehensive quiz covering Python fundamentals"
-            },
+            json=_CREATE_PAYLOAD,
             headers=auth_headers
         )
         
@@ -295,7 +278,7 @@ class TestTestEndpoints:
         # Create a test
         create_response = await client.post(
             "/tests/",
-            json={"title": "Original Title", "description": "Original description"},
+            json=_ORIGINAL_PAYLOAD,
             headers=auth_headers
         )
         
@@ -323,7 +306,7 @@ class TestTestEndpoints:
         # Create a test
         create_response = await client.post(
             "/tests/",
-            json={"title": "Original Title", "description": "Original description"},
+            json=_ORIGINAL_PAYLOAD,
             headers=auth_headers
         )
         
@@ -334,7 +317,7 @@ class TestTestEndpoints:
         # Update only the title
         response = await client.patch(
             f"/tests/{test_id}",
-            json={"title": "Updated Title"},
+            json=_UPDATED_TITLE_PAYLOAD,
             headers=auth_headers
         )
         
@@ -349,7 +332,7 @@ class TestTestEndpoints:
         """Test updating a nonexistent test."""
         response = await client.patch(
             "/tests/999999",
-            json={"title": "Updated Title"},
+            json=_UPDATED_TITLE_PAYLOAD,
             headers=auth_headers
         )
         
@@ -362,7 +345,7 @@ class TestTestEndpoints:
         """Test updating a test without authentication."""
         response = await client.patch(
             "/tests/1",
-            json={"title": "Updated Title"}
+            json=_UPDATED_TITLE_PAYLOAD
         )
         
         assert response.status_code == 403
@@ -435,38 +418,3 @@ class TestTestEndpoints:
         response = await client.patch("/tests/1/delete")
         
         assert response.status_code == 403
-    
-    @pytest.mark.asyncio
-    async def test_complete_test_workflow(self, client: AsyncClient, auth_headers: dict):
-        """Test complete workflow: create, read, update, delete."""
-        # Create a test
-        create_response = await client.post(
-            "/tests/",
-            json={"title": "Workflow Test", "description": "Testing complete workflow"},
-            headers=auth_headers
-        )
-        
-        assert create_response.status_code == 201
-        test_data = create_response.json()
-        test_id = test_data["id"]
-        
-        # Read the test
-        get_response = await client.get(f"/tests/{test_id}", headers=auth_headers)
-        assert get_response.status_code == 200
-        
-        # Update the test
-        update_response = await client.patch(
-            f"/tests/{test_id}",
-            json={"title": "Updated Workflow Test"},
-            headers=auth_headers
-        )
-        assert update_response.status_code == 200
-        assert update_response.json()["title"] == "Updated Workflow Test"
-        
-        # Delete the test
-        delete_response = await client.patch(f"/tests/{test_id}/delete", headers=auth_headers)
-        assert delete_response.status_code == 204
-        
-        # Verify deletion
-        final_get_response = await client.get(f"/tests/{test_id}", headers=auth_headers)
-        assert final_get_response.status_code == 404
\ No newline at end of file
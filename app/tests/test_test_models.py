@@ -4,52 +4,30 @@ Unit tests for Test model.
 import pytest
 import pytest_asyncio
 from datetime import datetime
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from app.core.database import Base
 from app.auth.models import User
 from app.test_management.models import Test
 
 
-# Test database URL (in-memory SQLite for testing)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
-
-# Create test engine and session
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-TestAsyncSession = async_sessionmaker(
-    test_engine, class_=AsyncSession, expire_on_commit=False
-)
-
-
 @pytest_asyncio.fixture
-async def db_session():
-    """Create test database session."""
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    async with TestAsyncSession() as session:
-        yield session
-        await session.rollback()
-    
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+async def user(db_session: AsyncSession):
+    """Create the owning user inside the test's rolled-back transaction."""
+    user = User(
+        email="test@example.com",
+        password_hash="hashed_password"
+    )
+    db_session.add(user)
+    await db_session.flush()
+    return user
 
 
 class TestTestModel:
     """Test cases for Test model validation and relationships."""
     
     @pytest.mark.asyncio
-    async def test_test_creation_with_required_fields(self, db_session: AsyncSession):
+    async def test_test_creation_with_required_fields(self, db_session: AsyncSession, user: User):
         """Test creating a test with required fields."""
-        # Create a user first
-        user = User(
-            email="test@example.com",
-            password_hash="hashed_password"
-        )
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
-        
         # Create test
         test = Test(
             title="Sample Test",
@@ -68,17 +46,8 @@ class TestTestModel:
         assert isinstance(test.updated_at, datetime)
     
     @pytest.mark.asyncio
-    async def test_test_creation_with_all_fields(self, db_session: AsyncSession):
+    async def test_test_creation_with_all_fields(self, db_session: AsyncSession, user: User):
         """Test creating a test with all fields including optional description."""
-        # Create a user first
-        user = User(
-            email="test@example.com",
-            password_hash="hashed_password"
-        )
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
-        
         # Create test with description
         test = Test(
             title="Comprehensive Test",
@@ -86,8 +55,7 @@ class TestTestModel:
             user_id=user.id
         )
         db_session.add(test)
-        await db_session.commit()
-        await db_session.refresh(test)
+        await db_session.flush()
         
         assert test.id is not None
         assert test.title == "Comprehensive Test"
@@ -96,17 +64,8 @@ class TestTestModel:
         assert test.is_deleted is False
     
     @pytest.mark.asyncio
-    async def test_test_creation_without_title_fails(self, db_session: AsyncSession):
+    async def test_test_creation_without_title_fails(self, db_session: AsyncSession, user: User):
         """Test that creating a test without title fails."""
-        # Create a user first
-        user = User(
-            email="test@example.com",
-            password_hash="hashed_password"
-        )
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
-        
         # Try to create test without title
         test = Test(
             user_id=user.id
@@ -138,45 +97,25 @@ class TestTestModel:
         )
         db_session.add(test)
         
-        # SQLite doesn't enforce foreign key constraints by default in tests
-        # This test verifies the model structure is correct
-        # In production with PostgreSQL, this would raise an IntegrityError
-        try:
+        # Foreign keys are enforced on the test database
+        with pytest.raises(IntegrityError):
             await db_session.commit()
-            # If we reach here, the test passes (SQLite behavior)
-            assert True
-        except IntegrityError:
-            # This would happen with PostgreSQL
-            assert True
     
     @pytest.mark.asyncio
-    async def test_test_user_relationship(self, db_session: AsyncSession):
+    async def test_test_user_relationship(self, db_session: AsyncSession, user: User):
         """Test the relationship between Test and User."""
         from sqlalchemy import select
         
-        # Create a user
-        user = User(
-            email="test@example.com",
-            password_hash="hashed_password"
-        )
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
-        
         # Create test
         test = Test(
             title="Relationship Test",
             user_id=user.id
         )
         db_session.add(test)
-        await db_session.commit()
-        await db_session.refresh(test)
+        await db_session.flush()
         
         # Test the relationship by querying
-        result = await db_session.execute(
-            select(User).where(User.id == test.user_id)
-        )
-        related_user = result.scalar_one()
+        related_user = await db_session.get(User, test.user_id)
         
         assert related_user is not None
         assert related_user.id == user.id
@@ -193,17 +132,8 @@ class TestTestModel:
         assert user_tests[0].title == "Relationship Test"
     
     @pytest.mark.asyncio
-    async def test_test_soft_delete_default(self, db_session: AsyncSession):
+    async def test_test_soft_delete_default(self, db_session: AsyncSession, user: User):
         """Test that is_deleted defaults to False."""
-        # Create a user first
-        user = User(
-            email="test@example.com",
-            password_hash="hashed_password"
-        )
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
-        
         # Create test
         test = Test(
             title="Default Delete Test",
@@ -211,22 +141,12 @@ class TestTestModel:
         )
         db_session.add(test)
         await db_session.commit()
-        await db_session.refresh(test)
         
         assert test.is_deleted is False
     
     @pytest.mark.asyncio
-    async def test_test_soft_delete_explicit(self, db_session: AsyncSession):
+    async def test_test_soft_delete_explicit(self, db_session: AsyncSession, user: User):
         """Test setting is_deleted explicitly."""
-        # Create a user first
-        user = User(
-            email="test@example.com",
-            password_hash="hashed_password"
-        )
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
-        
         # Create test with explicit soft delete
         test = Test(
             title="Explicit Delete Test",
@@ -234,31 +154,20 @@ class TestTestModel:
             is_deleted=True
         )
         db_session.add(test)
-        await db_session.commit()
-        await db_session.refresh(test)
+        await db_session.flush()
         
         assert test.is_deleted is True
     
     @pytest.mark.asyncio
-    async def test_test_string_representations(self, db_session: AsyncSession):
+    async def test_test_string_representations(self, db_session: AsyncSession, user: User):
         """Test __repr__ and __str__ methods."""
-        # Create a user first
-        user = User(
-            email="test@example.com",
-            password_hash="hashed_password"
-        )
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
-        
         # Create test
         test = Test(
             title="String Test",
             user_id=user.id
         )
         db_session.add(test)
-        await db_session.commit()
-        await db_session.refresh(test)
+        await db_session.flush()
         
         # Test string representations
         repr_str = repr(test)
@@ -272,26 +181,17 @@ class TestTestModel:
         assert f"Test {test.id}: String Test" == str_str
     
     @pytest.mark.asyncio
-    async def test_multiple_tests_per_user(self, db_session: AsyncSession):
+    async def test_multiple_tests_per_user(self, db_session: AsyncSession, user: User):
         """Test that a user can have multiple tests."""
         from sqlalchemy import select
         
-        # Create a user
-        user = User(
-            email="test@example.com",
-            password_hash="hashed_password"
-        )
-        db_session.add(user)
-        await db_session.commit()
-        await db_session.refresh(user)
-        
         # Create multiple tests
         test1 = Test(title="Test 1", user_id=user.id)
         test2 = Test(title="Test 2", user_id=user.id)
         test3 = Test(title="Test 3", user_id=user.id)
         
         db_session.add_all([test1, test2, test3])
-        await db_session.commit()
+        await db_session.flush()
         
         # Query all tests for the user
         result = await db_session.execute(
@@ -3,6 +3,7 @@ Unit tests for Test schemas.
 """
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
 from pydantic import ValidationError
 from app.test_management.schemas import (
     TestCreateRequest,
@@ -12,6 +13,21 @@ from app.test_management.schemas import (
 )
 
 
+# One character past the schema's title (200) and description (1000) limits
+_OVERLONG_TITLE = "A" * 201
+_OVERLONG_DESCRIPTION = "A" * 1001
+
+# Model-like object read through from_attributes; tests must not mutate it
+_MOCK_TEST = SimpleNamespace(
+    id=1,
+    title="Python Quiz",
+    description="A comprehensive quiz",
+    user_id=1,
+    created_at=datetime(2024, 1, 8, 10, 0, 0),
+    updated_at=datetime(2024, 1, 8, 10, 0, 0)
+)
+
+
 class TestTestCreateRequest:
     """Test cases for TestCreateRequest schema."""
     
@@ -38,64 +54,23 @@ class TestTestCreateRequest:
         assert request.title == "Python Basics Quiz"
         assert request.description is None
     
-    def test_test_create_request_empty_title_fails(self):
-        """Test that empty title fails validation."""
-        data = {
-            "title": "",
-            "description": "A quiz"
-        }
-        
-        with pytest.raises(ValidationError) as exc_info:
-            TestCreateRequest(**data)
-        
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert errors[0]["type"] == "string_too_short"
-        assert "title" in errors[0]["loc"]
-    
-    def test_test_create_request_missing_title_fails(self):
-        """Test that missing title fails validation."""
-        data = {
-            "description": "A quiz"
-        }
-        
+    @pytest.mark.parametrize(
+        "data, err_type, loc",
+        [
+            ({"title": "", "description": "A quiz"}, "string_too_short", "title"),
+            ({"description": "A quiz"}, "missing", "title"),
+            ({"title": _OVERLONG_TITLE, "description": "A quiz"}, "string_too_long", "title"),
+            ({"title": "Python Quiz", "description": _OVERLONG_DESCRIPTION}, "string_too_long", "description")
+        ],
+        ids=["empty_title", "missing_title", "title_too_long", "description_too_long"]
+    )
+    def test_test_create_request_invalid_data_fails(self, data, err_type, loc):
+        """Test that empty, missing and over-long fields fail validation."""
         with pytest.raises(ValidationError) as exc_info:
             TestCreateRequest(**data)
         
         errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert errors[0]["type"] == "missing"
-        assert "title" in errors[0]["loc"]
-    
-    def test_test_create_request_title_too_long_fails(self):
-        """Test that title longer than 200 characters fails validation."""
-        data = {
-            "title": "A" * 201,  # 201 characters
-            "description": "A quiz"
-        }
-        
-        with pytest.raises(ValidationError) as exc_info:
-            TestCreateRequest(**data)
-        
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert errors[0]["type"] == "string_too_long"
-        assert "title" in errors[0]["loc"]
-    
-    def test_test_create_request_description_too_long_fails(self):
-        """Test that description longer than 1000 characters fails validation."""
-        data = {
-            "title": "Python Quiz",
-            "description": "A" * 1001  # 1001 characters
-        }
-        
-        with pytest.raises(ValidationError) as exc_info:
-            TestCreateRequest(**data)
-        
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert errors[0]["type"] == "string_too_long"
-        assert "description" in errors[0]["loc"]
+        assert [(error["type"], error["loc"][0]) for error in errors] == [(err_type, loc)]
     
     def test_test_create_request_strips_whitespace(self):
         """Test that whitespace is stripped from strings."""
@@ -145,33 +120,21 @@ class TestTestUpdateRequest:
         assert request.title is None
         assert request.description is None
     
-    def test_test_update_request_empty_title_fails(self):
-        """Test that empty title fails validation."""
-        data = {
-            "title": ""
-        }
-        
-        with pytest.raises(ValidationError) as exc_info:
-            TestUpdateRequest(**data)
-        
-        errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert errors[0]["type"] == "string_too_short"
-        assert "title" in errors[0]["loc"]
-    
-    def test_test_update_request_title_too_long_fails(self):
-        """Test that title longer than 200 characters fails validation."""
-        data = {
-            "title": "A" * 201  # 201 characters
-        }
-        
+    @pytest.mark.parametrize(
+        "data, err_type, loc",
+        [
+            ({"title": ""}, "string_too_short", "title"),
+            ({"title": _OVERLONG_TITLE}, "string_too_long", "title")
+        ],
+        ids=["empty_title", "title_too_long"]
+    )
+    def test_test_update_request_invalid_data_fails(self, data, err_type, loc):
+        """Test that empty and over-long titles fail validation."""
         with pytest.raises(ValidationError) as exc_info:
             TestUpdateRequest(**data)
         
         errors = exc_info.value.errors()
-        assert len(errors) == 1
-        assert errors[0]["type"] == "string_too_long"
-        assert "title" in errors[0]["loc"]
+        assert [(error["type"], error["loc"][0]) for error in errors] == [(err_type, loc)]
     
     def test_test_update_request_strips_whitespace(self):
         """Test that whitespace is stripped from strings."""
@@ -245,17 +208,7 @@ class TestTestResponse:
     
     def test_test_response_from_model_object(self):
         """Test creating response from model-like object."""
-        class MockTest:
-            def __init__(self):
-                self.id = 1
-                self.title = "Python Quiz"
-                self.description = "A comprehensive quiz"
-                self.user_id = 1
-                self.created_at = datetime(2024, 1, 8, 10, 0, 0)
-                self.updated_at = datetime(2024, 1, 8, 10, 0, 0)
-        
-        mock_test = MockTest()
-        response = TestResponse.model_validate(mock_test)
+        response = TestResponse.model_validate(_MOCK_TEST)
         
         assert response.id == 1
         assert response.title == "Python Quiz"
@@ -5,7 +5,7 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import ValidationError
@@ -33,7 +33,7 @@ async def lifespan(app: FastAPI):
         await init_db()
         logger.info("Database initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        logger.error("Failed to initialize database: %s", e)
         raise
     
     yield
@@ -67,8 +67,8 @@ app.add_middleware(
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions."""
-    logger.warning(f"HTTP {exc.status_code} error on {request.url}: {exc.detail}")
-    return JSONResponse(
+    logger.warning("HTTP %s error on %s: %s", exc.status_code, request.url, exc.detail)
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "HTTP_ERROR",
@@ -81,13 +81,14 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors."""
-    logger.warning(f"Validation error on {request.url}: {exc.errors()}")
-    return JSONResponse(
+    errors = exc.errors()
+    logger.warning("Validation error on %s: %s", request.url, errors)
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "VALIDATION_ERROR",
             "message": "Request validation failed",
-            "details": exc.errors()
+            "details": errors
         }
     )
 
@@ -95,13 +96,14 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(ValidationError)
 async def pydantic_validation_exception_handler(request: Request, exc: ValidationError):
     """Handle Pydantic validation errors."""
-    logger.warning(f"Pydantic validation error on {request.url}: {exc.errors()}")
-    return JSONResponse(
+    errors = exc.errors()
+    logger.warning("Pydantic validation error on %s: %s", request.url, errors)
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "VALIDATION_ERROR",
             "message": "Data validation failed",
-            "details": exc.errors()
+            "details": errors
         }
     )
 
@@ -109,8 +111,8 @@ async def pydantic_validation_exception_handler(request: Request, exc: Validatio
 @app.exception_handler(SQLAlchemyError)
 async def database_exception_handler(request: Request, exc: SQLAlchemyError):
     """Handle database errors."""
-    logger.error(f"Database error on {request.url}: {str(exc)}")
-    return JSONResponse(
+    logger.error("Database error on %s: %s", request.url, exc)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "DATABASE_ERROR",
@@ -122,8 +124,8 @@ async def database_exception_handler(request: Request, exc: SQLAlchemyError):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle all other exceptions."""
-    logger.error(f"Unexpected error on {request.url}: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unexpected error on %s: %s", request.url, exc, exc_info=True)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "INTERNAL_SERVER_ERROR",
@@ -133,46 +135,51 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 
 # Include routers with API prefix
-app.include_router(auth_router, prefix="/api")
-app.include_router(test_router, prefix="/api")
-app.include_router(mcq_router, prefix="/api")
+for router in (auth_router, test_router, mcq_router):
+    app.include_router(router, prefix="/api")
+
+
+# Health check response bodies; settings are fixed for the process, so build them once
+_ROOT_BODY = {
+    "message": "MCQ Test Platform API",
+    "status": "running",
+    "version": "1.0.0",
+    "docs_url": "/docs" if settings.debug else "Documentation disabled in production"
+}
+_HEALTH_BODY = {
+    "status": "healthy",
+    "service": settings.app_name,
+    "version": "1.0.0",
+    "environment": "development" if settings.debug else "production"
+}
+_API_INFO_BODY = {
+    "message": "MCQ Test Platform API v1.0.0",
+    "endpoints": {
+        "authentication": "/api/auth",
+        "tests": "/api/tests",
+        "questions": "/api/questions"
+    },
+    "documentation": "/docs" if settings.debug else "Available in development mode only"
+}
 
 
 # Health check endpoints
-@app.get("/", tags=["health"])
+@app.get("/", tags=["health"], response_class=ORJSONResponse)
 async def root():
     """Root endpoint for basic API information."""
-    return {
-        "message": "MCQ Test Platform API",
-        "status": "running",
-        "version": "1.0.0",
-        "docs_url": "/docs" if settings.debug else "Documentation disabled in production"
-    }
+    return _ROOT_BODY
 
 
-@app.get("/health", tags=["health"])
+@app.get("/health", tags=["health"], response_class=ORJSONResponse)
 async def health_check():
     """Detailed health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": settings.app_name,
-        "version": "1.0.0",
-        "environment": "development" if settings.debug else "production"
-    }
+    return _HEALTH_BODY
 
 
-@app.get("/api", tags=["health"])
+@app.get("/api", tags=["health"], response_class=ORJSONResponse)
 async def api_info():
     """API information endpoint."""
-    return {
-        "message": "MCQ Test Platform API v1.0.0",
-        "endpoints": {
-            "authentication": "/api/auth",
-            "tests": "/api/tests",
-            "questions": "/api/questions"
-        },
-        "documentation": "/docs" if settings.debug else "Available in development mode only"
-    }
+    return _API_INFO_BODY
 
 
 if __name__ == "__main__":